@@ -0,0 +1,76 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+_square_core.pyx
+================
+Optional C kernels for square_points.py, for installs without numba.
+
+Built by setup.py when Cython is available at install time
+(`pip install Cython && pip install -e .`, or
+`python setup.py build_ext --inplace`); nothing imports it unconditionally.
+
+The Monte Carlo loop draws its uniforms from a splitmix64 generator whose
+state lives on the C stack, so it runs without the GIL and concurrent calls
+from several threads do not share RNG state.
+"""
+
+import random
+
+from libc.math cimport fmod
+from libc.stdint cimport uint64_t
+
+cdef uint64_t _GAMMA = 0x9E3779B97F4A7C15
+cdef uint64_t _MIX1 = 0xBF58476D1CE4E5B9
+cdef uint64_t _MIX2 = 0x94D049BB133111EB
+
+
+cdef inline double _uniform(uint64_t* state) noexcept nogil:
+    """splitmix64 step mapped to a double in [0, 1) with 53 random bits."""
+    state[0] += _GAMMA
+    cdef uint64_t z = state[0]
+    z = (z ^ (z >> 30)) * _MIX1
+    z = (z ^ (z >> 27)) * _MIX2
+    z = z ^ (z >> 31)
+    return <double>(z >> 11) * (1.0 / 9007199254740992.0)
+
+
+cdef inline (double, double) _p2xy(double t, double L) noexcept nogil:
+    """C version of square_points._perimeter_to_xy."""
+    cdef double four_L = 4.0 * L
+    t = fmod(t, four_L)
+    if t < 0.0:
+        t += four_L
+    if t < L:
+        return t, 0.0
+    elif t < 2.0 * L:
+        return L, t - L
+    elif t < 3.0 * L:
+        return 3.0 * L - t, L
+    return 0.0, four_L - t
+
+
+def perimeter_to_xy(double t, double L):
+    """Convert a parameter t to (x, y) on the boundary (see square_points._perimeter_to_xy)."""
+    return _p2xy(t, L)
+
+
+def monte_carlo_parametric(double L, long n, seed=None):
+    """Number of n sample_parametric pairs whose distance exceeds L.
+
+    The whole loop runs in C with the GIL released. `seed` (an int) makes
+    the result reproducible; by default it is drawn from the random module.
+    """
+    cdef uint64_t state = (random.getrandbits(64) if seed is None else seed) & 0xFFFFFFFFFFFFFFFF
+    cdef double four_L = 4.0 * L
+    cdef double L2 = L * L
+    cdef double x1, y1, x2, y2, dx, dy
+    cdef long hits = 0
+    cdef long i
+    with nogil:
+        for i in range(n):
+            x1, y1 = _p2xy(_uniform(&state) * four_L, L)
+            x2, y2 = _p2xy(_uniform(&state) * four_L, L)
+            dx = x1 - x2
+            dy = y1 - y2
+            if dx * dx + dy * dy > L2:
+                hits += 1
+    return hits
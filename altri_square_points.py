@@ -6,140 +6,231 @@ Alternative / early implementations of the five core sampling strategies.
 These were the original prototypes written before square_points.py was
 refactored. They are kept here for reference and comparison.
 The canonical, fully-documented versions live in square_points.py.
+
+Two independent continuous draws coincide with probability zero, so the
+samplers return the first pair drawn without a distinctness retry.
+
+Each method has a `make_<method>_v0(L)` factory returning a zero-argument
+sampler specialized for a fixed L: the constants derived from L are computed
+once, when the sampler is built, instead of on every call. The factory holds
+the method's only body; sample_<method>_v0(L) calls it, and its results are
+cached per (L, rng), so repeated calls with the same L do not rebuild the
+sampler. For the parametric method the factory is compile_parametric_v0,
+which generates the sampler's source with those constants written in as
+literals. Every factory and sampler takes an optional `rng` (a
+random.Random) for a private, reproducible stream.
 """
 
-import random
+import functools
 import math
-from typing import Tuple
+import random
+from typing import Callable, List, Optional, Tuple
 
 Point = Tuple[float, float]
+Sampler = Callable[[], Tuple[Point, Point]]
 
+# Bound once: `_rand() * L` skips the argument handling of random.uniform(0, L).
+# random.seed() reseeds it; a factory given its own random.Random (`rng`)
+# draws from that instance instead.
+_rand = random.random
 
-def _perimeter_to_xy(t: float, L: float) -> Point:
-    """Convert a parameter t ∈ [0, 4L) to (x, y) coordinates on the boundary."""
-    t = t % (4 * L)
-    if t < L:
-        return (t, 0.0)
-    elif t < 2 * L:
-        return (L, t - L)
-    elif t < 3 * L:
-        return (L - (t - 2 * L), L)
-    else:
-        return (0.0, L - (t - 3 * L))
+# The sample_<method>_v0 functions build their sampler with make_<method>_v0,
+# whose results are cached per (L, rng): a loop with a fixed L builds the
+# closure once and then pays one cache lookup per call.
+_FACTORY_CACHE = 64
 
 
-# ── Method 1: Linear parametrization ─────────────────────────────────────────
+# The inner sampler functions bind the module globals and builtins they call
+# as default arguments, so the hot bodies use fast local loads instead of
+# global / attribute lookups.
 
-def sample_parametric_v0(L: float) -> Tuple[Point, Point]:
-    """Unroll the perimeter into [0, 4L) and sample two distinct values t."""
-    t1 = random.uniform(0, 4 * L)
-    t2 = random.uniform(0, 4 * L)
-    while t1 == t2:   # near-impossible in floating point, but correct
-        t2 = random.uniform(0, 4 * L)
-    return _perimeter_to_xy(t1, L), _perimeter_to_xy(t2, L)
+# ── Method 1: Linear parametrization ─────────────────────────────────────────
 
+_PARAMETRIC_POINT_SRC = """\
+    t = _rand() * {four_L!r}
+    if t < {L!r}:
+        {p} = (t, 0.0)
+    elif t < {two_L!r}:
+        {p} = ({L!r}, t - {L!r})
+    elif t < {three_L!r}:
+        {p} = ({three_L!r} - t, {L!r})
+    else:
+        {p} = (0.0, {four_L!r} - t)
+"""
 
-# ── Method 2: Side index + position ──────────────────────────────────────────
 
-def sample_by_side_v0(L: float) -> Tuple[Point, Point]:
-    """Pick a random side (0=bottom, 1=right, 2=top, 3=left), then a position s ∈ [0, L].
+def compile_parametric_v0(L: float, rng: Optional[random.Random] = None) -> Sampler:
+    """Sampler for fixed L, generated from source with L baked in.
 
-    Note: uses integer side indices instead of string labels.
+    The source of the sampler is emitted with L, 2L, 3L and 4L written as float
+    literals and the boundary mapping inlined for both points, then compiled
+    with exec. The resulting bytecode loads the constants with LOAD_CONST
+    instead of reading closure cells, and makes no call besides _rand().
+    L must be a finite positive number (a numpy scalar is fine): its
+    multiples are converted to float so that their repr is a valid literal.
+    """
+    Lf = float(L)
+    if not (math.isfinite(Lf) and Lf > 0):
+        raise ValueError(f"Side length L must be finite and positive, got {L}")
+    consts = dict(L=Lf, two_L=2.0 * Lf, three_L=3.0 * Lf, four_L=4.0 * Lf)
+    src = (
+        "def sample(_rand=_rand):\n"
+        + _PARAMETRIC_POINT_SRC.format(p="p1", **consts)
+        + _PARAMETRIC_POINT_SRC.format(p="p2", **consts)
+        + "    return p1, p2\n"
+    )
+    namespace: dict = {}
+    exec(compile(src, f"<parametric_v0 L={Lf!r}>", "exec"), {"_rand": _rand if rng is None else rng.random}, namespace)
+    return namespace["sample"]
+
+
+@functools.lru_cache(maxsize=_FACTORY_CACHE)
+def make_parametric_v0(L: float, rng: Optional[random.Random] = None) -> Sampler:
+    """Sampler for fixed L: unroll the perimeter into [0, 4L) and sample two values t.
+
+    Built by compile_parametric_v0, so the mapping has a single definition.
     """
-    def pick_point() -> Point:
-        side = random.randint(0, 3)
-        s = random.uniform(0, L)
+    return compile_parametric_v0(L, rng)
+
+
+def sample_parametric_v0(L: float, rng: Optional[random.Random] = None) -> Tuple[Point, Point]:
+    """Unroll the perimeter into [0, 4L) and sample two values t."""
+    return make_parametric_v0(L, rng)()
+
+
+# ── Method 2: Side index + position ──────────────────────────────────────────
+
+@functools.lru_cache(maxsize=_FACTORY_CACHE)
+def make_by_side_v0(L: float, rng: Optional[random.Random] = None) -> Sampler:
+    """Sampler for fixed L: pick a random side (0=bottom, 1=right, 2=top, 3=left), then s ∈ [0, L]."""
+    def pick_point(_rand=_rand if rng is None else rng.random, _int=int) -> Point:
+        side = _int(_rand() * 4)
+        s = _rand() * L
         if side == 0: return (s, 0.0)
         if side == 1: return (L, s)
         if side == 2: return (s, L)
         return (0.0, s)
 
-    p1 = pick_point()
-    p2 = pick_point()
-    while p1 == p2:
-        p2 = pick_point()
-    return p1, p2
+    def sample(pick_point=pick_point) -> Tuple[Point, Point]:
+        return pick_point(), pick_point()
+
+    return sample
+
+
+def sample_by_side_v0(L: float, rng: Optional[random.Random] = None) -> Tuple[Point, Point]:
+    """Pick a random side (0=bottom, 1=right, 2=top, 3=left), then a position s ∈ [0, L].
+
+    Note: uses integer side indices instead of string labels.
+    """
+    return make_by_side_v0(L, rng)()
 
 
 # ── Method 3: Cartesian boundary ─────────────────────────────────────────────
 
-def sample_cartesian_v0(L: float) -> Tuple[Point, Point]:
-    """Fix x or y to 0 or L, sample the other coordinate uniformly in [0, L]."""
-    def pick_point() -> Point:
-        if random.random() < 0.5:        # fix x
-            x = random.choice([0.0, L])
-            y = random.uniform(0, L)
+@functools.lru_cache(maxsize=_FACTORY_CACHE)
+def make_cartesian_v0(L: float, rng: Optional[random.Random] = None) -> Sampler:
+    """Sampler for fixed L: fix x or y to 0 or L, sample the other coordinate."""
+    def pick_point(_rand=_rand if rng is None else rng.random) -> Point:
+        if _rand() < 0.5:        # fix x
+            x = L * (_rand() < 0.5)
+            y = _rand() * L
             return (x, y)
         else:                             # fix y
-            y = random.choice([0.0, L])
-            x = random.uniform(0, L)
+            y = L * (_rand() < 0.5)
+            x = _rand() * L
             return (x, y)
 
-    p1 = pick_point()
-    p2 = pick_point()
-    while p1 == p2:
-        p2 = pick_point()
-    return p1, p2
+    def sample(pick_point=pick_point) -> Tuple[Point, Point]:
+        return pick_point(), pick_point()
+
+    return sample
+
+
+def sample_cartesian_v0(L: float, rng: Optional[random.Random] = None) -> Tuple[Point, Point]:
+    """Fix x or y to 0 or L, sample the other coordinate uniformly in [0, L]."""
+    return make_cartesian_v0(L, rng)()
 
 
 # ── Method 4: Polar angle from center ────────────────────────────────────────
 
-def sample_polar_angle_v0(L: float) -> Tuple[Point, Point]:
+@functools.lru_cache(maxsize=_FACTORY_CACHE)
+def make_polar_angle_v0(L: float, rng: Optional[random.Random] = None) -> Sampler:
+    """Sampler for fixed L: cast rays from the center at two angles θ ∈ [0, 2π)."""
+    half = L * 0.5              # also the center coordinate cx = cy
+    two_pi = 6.283185307179586  # 2π
+    half_pi = 1.5707963267948966
+    octants = 1.2732395447351628  # 4/π: octants per radian
+
+    def angle_to_point(theta: float, _tan=math.tan, _min=min, _max=max, _int=int) -> Point:
+        # The octant of θ fixes the wall the ray hits; the offset from the
+        # wall's midpoint is half·tan of the angle measured from its normal.
+        octant = _int(theta * octants)
+        if octant == 0 or octant >= 7:   # right wall
+            return (L, _min(L, _max(0.0, half + half * _tan(theta))))
+        if octant <= 2:                  # top wall
+            return (_min(L, _max(0.0, half + half * _tan(half_pi - theta))), L)
+        if octant <= 4:                  # left wall
+            return (0.0, _min(L, _max(0.0, half - half * _tan(theta))))
+        return (_min(L, _max(0.0, half - half * _tan(half_pi - theta))), 0.0)  # bottom wall
+
+    def sample(_rand=_rand if rng is None else rng.random,
+               to_point=angle_to_point) -> Tuple[Point, Point]:
+        return to_point(_rand() * two_pi), to_point(_rand() * two_pi)
+
+    return sample
+
+
+def sample_polar_angle_v0(L: float, rng: Optional[random.Random] = None) -> Tuple[Point, Point]:
     """Sample two angles θ ∈ [0, 2π) and cast rays from the center to the boundary."""
-    def angle_to_point(theta: float) -> Point:
-        cx, cy = L / 2, L / 2
-        cos_t, sin_t = math.cos(theta), math.sin(theta)
-        half = L / 2
-        if abs(cos_t) > abs(sin_t):   # ray hits left or right wall first
-            scale = half / abs(cos_t)
-        else:                          # ray hits bottom or top wall first
-            scale = half / abs(sin_t)
-        x = max(0.0, min(L, cx + cos_t * scale))
-        y = max(0.0, min(L, cy + sin_t * scale))
-        return (x, y)
-
-    theta1 = random.uniform(0, 2 * math.pi)
-    theta2 = random.uniform(0, 2 * math.pi)
-    while abs(theta1 - theta2) < 1e-12:
-        theta2 = random.uniform(0, 2 * math.pi)
-    return angle_to_point(theta1), angle_to_point(theta2)
+    return make_polar_angle_v0(L, rng)()
 
 
 # ── Method 5: Interior projection ────────────────────────────────────────────
 
-def sample_interior_projection_v0(L: float) -> Tuple[Point, Point]:
-    """Sample a random interior point and project it onto the nearest side."""
-    def project_to_border(x: float, y: float) -> Point:
+@functools.lru_cache(maxsize=_FACTORY_CACHE)
+def make_interior_projection_v0(L: float, rng: Optional[random.Random] = None) -> Sampler:
+    """Sampler for fixed L: project random interior points onto the nearest side."""
+    def project_to_border(x: float, y: float, _min=min) -> Point:
         d = {"bottom": y, "top": L - y, "left": x, "right": L - x}
-        nearest = min(d, key=d.get)
+        nearest = _min(d, key=d.get)
         if nearest == "bottom": return (x, 0.0)
         if nearest == "top":    return (x, L)
         if nearest == "left":   return (0.0, y)
         return (L, y)
 
-    def pick_point() -> Point:
-        return project_to_border(random.uniform(0, L), random.uniform(0, L))
+    def pick_point(_rand=_rand if rng is None else rng.random,
+                   project=project_to_border) -> Point:
+        return project(_rand() * L, _rand() * L)
+
+    def sample(pick_point=pick_point) -> Tuple[Point, Point]:
+        return pick_point(), pick_point()
+
+    return sample
+
+
+def sample_interior_projection_v0(L: float, rng: Optional[random.Random] = None) -> Tuple[Point, Point]:
+    """Sample a random interior point and project it onto the nearest side."""
+    return make_interior_projection_v0(L, rng)()
+
 
-    p1 = pick_point()
-    p2 = pick_point()
-    while p1 == p2:
-        p2 = pick_point()
-    return p1, p2
+# (name, factory) of each method; build the samplers once per L with
+# `[make(L) for _, make in SAMPLER_FACTORIES]`.
+SAMPLER_FACTORIES: List[Tuple[str, Callable[[float], Sampler]]] = [
+    ("1 - Parametric (v0)         ", make_parametric_v0),
+    ("2 - Side index + pos (v0)   ", make_by_side_v0),
+    ("3 - Cartesian (v0)          ", make_cartesian_v0),
+    ("4 - Polar angle (v0)        ", make_polar_angle_v0),
+    ("5 - Interior projection (v0)", make_interior_projection_v0),
+]
 
 
 # ── Demo ──────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
     L = 5.0
-    methods = [
-        ("1 - Parametric (v0)         ", sample_parametric_v0),
-        ("2 - Side index + pos (v0)   ", sample_by_side_v0),
-        ("3 - Cartesian (v0)          ", sample_cartesian_v0),
-        ("4 - Polar angle (v0)        ", sample_polar_angle_v0),
-        ("5 - Interior projection (v0)", sample_interior_projection_v0),
-    ]
+    samplers = [(name, make(L)) for name, make in SAMPLER_FACTORIES]
 
     print(f"Square side L = {L}\n")
-    for name, fn in methods:
-        p1, p2 = fn(L)
+    for name, sample in samplers:
+        p1, p2 = sample()
         print(f"Method {name}  P1=({p1[0]:.4f},{p1[1]:.4f})  P2=({p2[0]:.4f},{p2[1]:.4f})")
@@ -0,0 +1,147 @@
+"""
+analysis_driver.py
+==================
+Command line, result table and CSV output shared by the distance-analysis
+scripts.
+
+A script supplies the labels of its methods and an `analyze(L, iterations)`
+function returning one statistics tuple per method:
+
+    (count_gt_L, attempts, mean, std, min, max, shortest_wins, longest_wins)
+
+and hands both to `main`, which parses the command line (when no iterations
+are given), prints one table per iteration count and optionally writes the
+rows to a CSV file.
+
+Usage:
+    from analysis_driver import main
+    main(labels, analyze, default_iterations=100, default_L=10.0)
+"""
+
+import argparse
+import contextlib
+import csv
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+Stats = Tuple[int, int, float, float, float, float, int, int]
+Analyze = Callable[[float, int], List[Stats]]
+
+CSV_HEADER = [
+    "method", "iterations", "count_gt_L", "attempts",
+    "percent", "mean", "std", "min", "max",
+    "shortest_wins", "longest_wins"
+]
+
+# Column widths
+CM = 30; CC = 6; CA = 8; CP = 7; CME = 8; CS = 8; CMI = 8; CMA = 8; CMINW = 9; CMAXW = 8
+
+HEADER = (
+    f"{'Method':<{CM}} | "
+    f"{'Count':>{CC}} | "
+    f"{'Attempts':>{CA}} | "
+    f"{'  >L %':>{CP}} | "
+    f"{'Mean':>{CME}} | "
+    f"{'Std':>{CS}} | "
+    f"{'Min':>{CMI}} | "
+    f"{'Max':>{CMA}} | "
+    f"{'#Shortest':>{CMINW}} | "
+    f"{'#Longest':>{CMAXW}}"
+)
+SEPARATOR = "-" * len(HEADER)
+
+
+def parse_args(description: str, default_iterations: int = 100,
+               default_L: float = 10.0) -> argparse.Namespace:
+    """Parse --iterations/-n (one or more values), --L and --csv."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--iterations", "-n", type=int, nargs="+", default=[default_iterations],
+        help=f"Number of iterations (default {default_iterations})"
+    )
+    parser.add_argument("--L", type=float, default=default_L,
+                        help=f"Side length L (default {default_L:g})")
+    parser.add_argument("--csv", type=str, default=None, help="CSV output file path")
+    return parser.parse_args()
+
+
+def run(labels: Sequence[str], analyze: Analyze, iterations: Sequence[int],
+        L: float, csv_path: Optional[str] = None) -> None:
+    """Print the result table for each iteration count, and write the rows to csv_path."""
+    csv_file = None
+    if csv_path:
+        try:
+            csv_file = open(csv_path, "w", newline="", encoding="utf-8")
+        except OSError as e:
+            print(f"Cannot open '{csv_path}': {e}")
+
+    with csv_file or contextlib.nullcontext():
+        if csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(CSV_HEADER)
+
+        for iter_val in iterations:
+            print(f"\nRunning analysis: iterations={iter_val}, L={L}\n")
+
+            stats = analyze(L, iter_val)
+
+            print(HEADER)
+            print(SEPARATOR)
+
+            csv_rows = []
+            for name, row in zip(labels, stats):
+                count, attempts, mean, std, d_min, d_max, min_wins, max_wins = row
+                pct = (count / attempts * 100) if attempts > 0 else 0.0
+                print(
+                    f"{name:<{CM}} | "
+                    f"{count:{CC}d} | "
+                    f"{attempts:{CA}d} | "
+                    f"{pct:{CP}.2f}% | "
+                    f"{mean:{CME}.3f} | "
+                    f"{std:{CS}.3f} | "
+                    f"{d_min:{CMI}.3f} | "
+                    f"{d_max:{CMA}.3f} | "
+                    f"{min_wins:{CMINW}d} | "
+                    f"{max_wins:{CMAXW}d}"
+                )
+                csv_rows.append([
+                    name, iter_val, count, attempts,
+                    f"{pct:.3f}", f"{mean:.3f}", f"{std:.3f}",
+                    f"{d_min:.3f}", f"{d_max:.3f}",
+                    min_wins, max_wins
+                ])
+
+            if csv_file:
+                try:
+                    csv_writer.writerows(csv_rows)
+                except OSError as e:
+                    print(f"CSV write error: {e}")
+
+    if csv_file:
+        print(f"\nResults written to '{csv_path}'")
+
+
+def main(labels: Sequence[str], analyze: Analyze,
+         iterations: Union[int, Sequence[int], None] = None, L: float = 10.0,
+         csv_path: Optional[str] = None, description: str = "",
+         default_iterations: int = 100, default_L: float = 10.0) -> None:
+    """
+    Entry point of an analysis script.
+
+    Args:
+        labels:      display name of each method, in the order of analyze's rows
+        analyze:     analyze(L, iterations) -> list of statistics tuples
+        iterations:  int or list of int. If None, the command line is parsed
+                     (with default_iterations / default_L as defaults)
+        L:           square side length, when iterations is given
+        csv_path:    path to CSV output file (optional)
+        description: argparse description
+    """
+    if iterations is None:
+        args = parse_args(description, default_iterations, default_L)
+        iteration_values = args.iterations
+        L = args.L
+        csv_path = args.csv
+    else:
+        iteration_values = [iterations] if isinstance(iterations, int) else list(iterations)
+
+    run(labels, analyze, iteration_values, L, csv_path)
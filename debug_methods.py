@@ -24,7 +24,7 @@ from square_points import (
     sample_polar_angle,
     sample_interior_projection,
 )
-from utils.helpers import is_on_perimeter, side_of
+from utils.helpers import SIDES, is_on_perimeter, side_index, side_of
 
 
 def debug_method(method, method_name: str, L: float = 10, iterations: int = 100):
@@ -33,24 +33,21 @@ def debug_method(method, method_name: str, L: float = 10, iterations: int = 100)
     print(f"Debugging: {method_name}")
     print(f"{'='*70}")
 
-    edge_counts = {"bottom": 0, "top": 0, "left": 0, "right": 0,
-                   "corner": 0, "off": 0}
+    counts = [0] * len(SIDES)   # indexed by side_index
+    off_idx = SIDES.index("off")
     points_list = []
 
     for i in range(iterations):
         try:
             p1, p2 = method(L)
             points_list.extend([(p1, "p1"), (p2, "p2")])
-            for p in [p1, p2]:
-                label = side_of(p, L)
-                if label in edge_counts:
-                    edge_counts[label] += 1
-                else:
-                    edge_counts["off"] += 1
+            counts[side_index(p1, L)] += 1
+            counts[side_index(p2, L)] += 1
         except Exception as e:
             print(f"  ERROR in iteration {i}: {e}")
-            edge_counts["off"] += 2
+            counts[off_idx] += 2
 
+    edge_counts = dict(zip(SIDES, counts))
     total = iterations * 2
     print(f"\nDistribution of {total} points ({iterations} iterations):")
     for edge, count in edge_counts.items():
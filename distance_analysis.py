@@ -8,11 +8,10 @@ Usage:
     .venv\\Scripts\\python.exe distance_analysis.py --iterations 100 --L 10
 
 """
-import math
-import argparse
-import csv
 from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from square_points import (
     sample_parametric,
     sample_by_side,
@@ -24,6 +23,9 @@ from square_points import (
     sample_polar_angle,
     sample_interior_projection,
 )
+import analysis_driver
+from vector_samplers import sample_all_methods
+from numba_kernels import HAVE_NUMBA, METHOD_IDS, run_all_nb
 
 METHODS: List[Tuple[str, Callable]] = [
     ("1. Parametric",              sample_parametric),
@@ -38,172 +40,135 @@ METHODS: List[Tuple[str, Callable]] = [
 ]
 
 N = len(METHODS)
+METHOD_NAMES = [fn.__name__ for _, fn in METHODS]
+KERNEL_IDS = np.array([METHOD_IDS[fn.__name__] for _, fn in METHODS], dtype=np.int64)
+
+
+# Iterations sampled per pass; peak memory is a few (N, CHUNK_SIZE) arrays
+# regardless of the total number of iterations.
+CHUNK_SIZE = 1 << 16
 
 
-def euclidean(a: Tuple[float, float], b: Tuple[float, float]) -> float:
-    return math.hypot(a[0] - b[0], a[1] - b[1])
+def _new_stats() -> Dict[str, np.ndarray]:
+    """Empty running statistics, one entry per method."""
+    return {
+        "count":      np.zeros(N, dtype=np.int64),
+        "count_gt_L": np.zeros(N, dtype=np.int64),
+        "mean":       np.zeros(N),
+        "m2":         np.zeros(N),
+        "min":        np.full(N, np.inf),
+        "max":        np.full(N, -np.inf),
+        "min_wins":   np.zeros(N, dtype=np.int64),
+        "max_wins":   np.zeros(N, dtype=np.int64),
+    }
 
 
-def run_all(L: float, iterations: int) -> Dict:
+def _accumulate(stats: Dict[str, np.ndarray], distances: np.ndarray,
+                min_wins: np.ndarray, max_wins: np.ndarray, L: float) -> None:
+    """Fold an (N, n) chunk of distances into the running statistics.
+
+    Mean and sum of squared deviations (m2) are merged with the pairwise
+    update of Chan et al., which stays accurate where sum / sum-of-squares
+    would cancel for large distances.
+    """
+    n = distances.shape[1]
+    if not n:
+        return
+    chunk_mean = distances.mean(axis=1)
+    chunk_m2 = np.square(distances - chunk_mean[:, None]).sum(axis=1)
+
+    count = stats["count"]
+    total = count + n
+    delta = chunk_mean - stats["mean"]
+    stats["mean"] += delta * (n / total)
+    stats["m2"] += chunk_m2 + delta * delta * (count * n / total)
+    stats["count"] = total
+
+    stats["count_gt_L"] += np.count_nonzero(distances > L, axis=1)
+    np.minimum(stats["min"], distances.min(axis=1), out=stats["min"])
+    np.maximum(stats["max"], distances.max(axis=1), out=stats["max"])
+    stats["min_wins"] += min_wins
+    stats["max_wins"] += max_wins
+
+
+def run_all(L: float, iterations: int, rng: Optional[np.random.Generator] = None,
+            chunk_size: int = CHUNK_SIZE) -> Dict:
     """
-    Run `iterations` iterations. At each step all methods are called and
-    their distances are collected. Returns a dict with:
-      - 'distances': list of N lists of float (one per method, None on exception)
-      - 'min_wins':  list of N ints (how many times the method produced the minimum distance)
-      - 'max_wins':  list of N ints (how many times the method produced the maximum distance)
-    In case of a tie (identical distances) all tied methods are counted.
+    Run `iterations` iterations. At each step all methods are sampled and
+    their distances are measured. Iterations are processed in chunks of
+    `chunk_size`; `vector_samplers.sample_all_methods` draws each chunk for
+    every method in a single fused NumPy pass, and the chunk is folded into
+    running statistics, so the full distance matrix is never materialized.
+    Returns a dict of length-N arrays (one entry per method):
+      - 'count', 'count_gt_L':  number of distances, and of distances > L
+      - 'mean', 'm2':           mean and sum of squared deviations from it
+      - 'min', 'max':           extreme distances
+      - 'min_wins', 'max_wins': how many times the method produced the
+                                shortest / longest distance of its iteration
+    Distances are continuous, so ties have probability zero; exactly one method
+    is credited per iteration (the first one in METHODS order if a tie occurs).
+
+    When numba is installed and no `rng` is given, the fused compiled loop
+    `numba_kernels.run_all_nb` is used instead of the NumPy batch samplers.
+
+    L is validated once, up front; the sampling loop itself never raises.
     """
-    distances: List[List[Optional[float]]] = [[] for _ in range(N)]
-    min_wins = [0] * N
-    max_wins = [0] * N
-
-    for _ in range(iterations):
-        row: List[Optional[float]] = []
-        for _, fn in METHODS:
-            try:
-                p1, p2 = fn(L)
-                row.append(euclidean(p1, p2))
-            except Exception:
-                row.append(None)
-
-        valid = [(i, d) for i, d in enumerate(row) if d is not None]
-        if valid:
-            min_d = min(d for _, d in valid)
-            max_d = max(d for _, d in valid)
-            for i, d in valid:
-                if math.isclose(d, min_d, rel_tol=1e-9):
-                    min_wins[i] += 1
-                if math.isclose(d, max_d, rel_tol=1e-9):
-                    max_wins[i] += 1
-
-        for i, d in enumerate(row):
-            distances[i].append(d)
-
-    return {"distances": distances, "min_wins": min_wins, "max_wins": max_wins}
+    if L <= 0:
+        raise ValueError(f"Side length L must be positive, got {L}")
+
+    use_numba = HAVE_NUMBA and rng is None
+    stats = _new_stats()
+    for start in range(0, iterations, chunk_size):
+        n = min(chunk_size, iterations - start)
+        if use_numba:
+            distances, min_wins, max_wins = run_all_nb(float(L), n, KERNEL_IDS)
+        else:
+            distances = sample_all_methods(L, n, METHOD_NAMES, rng)
+            min_wins = np.bincount(np.argmin(distances, axis=0), minlength=N)
+            max_wins = np.bincount(np.argmax(distances, axis=0), minlength=N)
+        _accumulate(stats, distances, min_wins, max_wins, L)
+    return stats
 
 
 def summarize(data: Dict, L: float) -> List[Tuple]:
-    """Compute statistics for each method from the result of run_all."""
+    """Compute statistics for each method from the result of run_all.
+
+    The distances > L are already counted by run_all, which is passed the
+    same L. A method with no distances reports zeros.
+    """
     results = []
     for i in range(N):
-        dlist = [d for d in data["distances"][i] if d is not None]
-        if not dlist:
+        count = int(data["count"][i])
+        if not count:
             results.append((0, 0, 0.0, 0.0, 0.0, 0.0, 0, 0))
             continue
-        attempts = len(dlist)
-        count_gt_L = sum(1 for d in dlist if d > L)
-        mean = sum(dlist) / attempts
-        variance = sum((d - mean) ** 2 for d in dlist) / attempts
-        std = math.sqrt(variance)
-        d_min = min(dlist)
-        d_max = max(dlist)
         results.append((
-            count_gt_L, attempts, mean, std, d_min, d_max,
-            data["min_wins"][i], data["max_wins"][i]
+            int(data["count_gt_L"][i]), count,
+            float(data["mean"][i]), float(np.sqrt(data["m2"][i] / count)),
+            float(data["min"][i]), float(data["max"][i]),
+            int(data["min_wins"][i]), int(data["max_wins"][i])
         ))
     return results
 
 
+def analyze(L: float, iterations: int) -> List[Tuple]:
+    """Run all methods for `iterations` iterations and return their statistics."""
+    return summarize(run_all(L, iterations), L)
+
+
 def main(iterations=None, L=10.0, csv_path=None):
     """
-    Run the distance analysis.
+    Run the distance analysis (table and CSV output: see analysis_driver).
 
     Args:
         iterations: int or list of int. If None, uses argparse (default 100).
         L:          square side length (default 10.0)
         csv_path:   path to CSV output file (optional)
     """
-    if iterations is None:
-        parser = argparse.ArgumentParser(
-            description="Distance > L analysis for square point sampling methods"
-        )
-        parser.add_argument(
-            "--iterations", "-n", type=int, nargs="+", default=[100],
-            help="Number of iterations (default 100)"
-        )
-        parser.add_argument("--L", type=float, default=10.0, help="Side length L (default 10)")
-        parser.add_argument("--csv", type=str, default=None, help="CSV output file path")
-        args = parser.parse_args()
-        iteration_values = args.iterations
-        L = args.L
-        csv_path = args.csv
-    else:
-        iteration_values = [iterations] if isinstance(iterations, int) else list(iterations)
-
-    # Column widths
-    CM = 30; CC = 6; CA = 8; CP = 7; CME = 8; CS = 8; CMI = 8; CMA = 8; CMINW = 9; CMAXW = 8
-
-    header = (
-        f"{'Method':<{CM}} | "
-        f"{'Count':>{CC}} | "
-        f"{'Attempts':>{CA}} | "
-        f"{'  >L %':>{CP}} | "
-        f"{'Mean':>{CME}} | "
-        f"{'Std':>{CS}} | "
-        f"{'Min':>{CMI}} | "
-        f"{'Max':>{CMA}} | "
-        f"{'#Shortest':>{CMINW}} | "
-        f"{'#Longest':>{CMAXW}}"
+    analysis_driver.main(
+        [name for name, _ in METHODS], analyze, iterations, L, csv_path,
+        description="Distance > L analysis for square point sampling methods",
     )
-    separator = "-" * len(header)
-
-    # CSV setup
-    csv_file = None
-    if csv_path:
-        try:
-            csv_file = open(csv_path, "w", newline="", encoding="utf-8")
-            csv_writer = csv.writer(csv_file)
-            csv_writer.writerow([
-                "method", "iterations", "count_gt_L", "attempts",
-                "percent", "mean", "std", "min", "max",
-                "shortest_wins", "longest_wins"
-            ])
-        except Exception as e:
-            print(f"Cannot open '{csv_path}': {e}")
-            csv_file = None
-
-    for iter_val in iteration_values:
-        print(f"\nRunning analysis: iterations={iter_val}, L={L}\n")
-
-        data = run_all(L, iter_val)
-        stats = summarize(data, L)
-
-        print(header)
-        print(separator)
-
-        for i, (name, _) in enumerate(METHODS):
-            count, attempts, mean, std, d_min, d_max, min_wins, max_wins = stats[i]
-            pct = (count / attempts * 100) if attempts > 0 else 0.0
-            print(
-                f"{name:<{CM}} | "
-                f"{count:{CC}d} | "
-                f"{attempts:{CA}d} | "
-                f"{pct:{CP}.2f}% | "
-                f"{mean:{CME}.3f} | "
-                f"{std:{CS}.3f} | "
-                f"{d_min:{CMI}.3f} | "
-                f"{d_max:{CMA}.3f} | "
-                f"{min_wins:{CMINW}d} | "
-                f"{max_wins:{CMAXW}d}"
-            )
-
-        if csv_file:
-            try:
-                for i, (name, _) in enumerate(METHODS):
-                    count, attempts, mean, std, d_min, d_max, min_wins, max_wins = stats[i]
-                    pct = (count / attempts * 100) if attempts > 0 else 0.0
-                    csv_writer.writerow([
-                        name, iter_val, count, attempts,
-                        f"{pct:.3f}", f"{mean:.3f}", f"{std:.3f}",
-                        f"{d_min:.3f}", f"{d_max:.3f}",
-                        min_wins, max_wins
-                    ])
-            except Exception as e:
-                print(f"CSV write error: {e}")
-
-    if csv_file:
-        csv_file.close()
-        print(f"\nResults written to '{csv_path}'")
 
 
 if __name__ == "__main__":
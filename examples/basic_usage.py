@@ -13,6 +13,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
+
 from square_points import (
     sample_parametric,
     sample_by_side,
@@ -27,6 +29,8 @@ from square_points import (
 )
 from utils.helpers import is_on_perimeter, euclidean, side_of
 from models.shapes import Square
+from vector_samplers import BATCH_SAMPLERS
+from numba_kernels import HAVE_NUMBA, METHOD_IDS, count_hits_nb
 
 
 # ── Example 1: Generate a single pair of points ───────────────────────────────
@@ -38,11 +42,12 @@ def example_single_pair():
 
     L = 10.0
     p1, p2 = sample_parametric(L)
+    d = euclidean(p1, p2)
 
     print(f"Square side: L = {L}")
     print(f"Point 1: ({p1[0]:.4f}, {p1[1]:.4f})  side: {side_of(p1, L)}")
     print(f"Point 2: ({p2[0]:.4f}, {p2[1]:.4f})  side: {side_of(p2, L)}")
-    print(f"Distance: {euclidean(p1, p2):.4f}  (> L: {euclidean(p1, p2) > L})")
+    print(f"Distance: {d:.4f}  (> L: {d > L})")
     print(f"Both on perimeter: {is_on_perimeter(p1, L) and is_on_perimeter(p2, L)}")
     print(f"Distinct: {_is_distinct(p1, p2)}")
 
@@ -69,9 +74,10 @@ def example_compare_methods():
 
     print(f"{'Method':<30} {'P1':^22} {'P2':^22} {'Dist':>7}")
     print("-" * 85)
+    hypot = math.hypot
     for name, fn in methods:
         p1, p2 = fn(L)
-        d = euclidean(p1, p2)
+        d = hypot(p1[0] - p2[0], p1[1] - p2[1])
         print(f"{name}  ({p1[0]:6.3f},{p1[1]:6.3f})  ({p2[0]:6.3f},{p2[1]:6.3f})  {d:7.3f}")
 
 
@@ -92,8 +98,19 @@ def example_monte_carlo(n: int = 50_000):
     theoretical = 0.3573
     print(f"Theoretical value (uniform): {theoretical:.4f}\n")
 
+    # With numba, sampling and counting run fused in the compiled
+    # count_hits_nb loop; otherwise all n pairs of a method are drawn at once
+    # by its NumPy batch twin. d > L is tested as d² > L², which needs no
+    # square root.
+    L2 = L * L
     for name, fn in methods:
-        hits = sum(1 for _ in range(n) if euclidean(*fn(L)) > L)
+        if HAVE_NUMBA:
+            hits = count_hits_nb(L, n, METHOD_IDS[fn.__name__])
+        else:
+            x1, y1, x2, y2 = BATCH_SAMPLERS[fn.__name__](L, n)
+            dx = x1 - x2
+            dy = y1 - y2
+            hits = np.count_nonzero(dx * dx + dy * dy > L2)
         pct = hits / n * 100
         print(f"  {name}  {pct:.2f}%")
 
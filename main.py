@@ -9,6 +9,9 @@ per-method statistics and a comparative report.
 """
 
 import sys
+
+import numpy as np
+
 from square_points import (
     sample_parametric,
     sample_by_side,
@@ -20,6 +23,28 @@ from square_points import (
     sample_polar_angle,
     sample_interior_projection,
 )
+from vector_samplers import BATCH_SAMPLERS, on_perimeter_batch
+
+
+EDGES = ("bottom", "top", "left", "right")
+
+CATEGORIES = {
+    "Uniform on perimeter": [
+        "1. Parametric",
+        "2. Side Selection",
+        "3. Edge Label",
+        "5. Side + Position",
+        "6. Parametric (Modular)",
+        "7. Cartesian",
+    ],
+    "Uniform polar angle (non-uniform perimeter)": [
+        "4. Polar Ray",
+        "8. Polar Angle",
+    ],
+    "Interior projection (non-uniform)": [
+        "9. Interior Projection",
+    ],
+}
 
 
 def print_points(p1, p2):
@@ -28,79 +53,124 @@ def print_points(p1, p2):
     print(f"  Point 2: ({p2[0]:.4f}, {p2[1]:.4f})")
 
 
-def verify_on_perimeter(point, L, tolerance=1e-9):
-    """Return True if the point lies on the perimeter of [0,L]×[0,L]."""
-    x, y = point
-    on_bottom = abs(y) < tolerance and 0 <= x <= L
-    on_top    = abs(y - L) < tolerance and 0 <= x <= L
-    on_left   = abs(x) < tolerance and 0 <= y <= L
-    on_right  = abs(x - L) < tolerance and 0 <= y <= L
-    return on_bottom or on_top or on_left or on_right
+def _sample_scalar(method, L, iterations):
+    """Fallback for methods without a batch twin: call `method` once per iteration.
+
+    Returns the pairs as arrays (x1, y1, x2, y2) and the error message of
+    every failed call. The pairs are written into a preallocated array;
+    rows of failed calls are dropped at the end.
+    """
+    out = np.empty((iterations, 4))
+    ok = np.ones(iterations, dtype=bool)
+    errors = []
+    for i in range(iterations):
+        try:
+            (out[i, 0], out[i, 1]), (out[i, 2], out[i, 3]) = method(L)
+        except Exception as e:
+            errors.append(f"Iteration {i+1}: ERROR - {e}")
+            ok[i] = False
+    x1, y1, x2, y2 = (out if not errors else out[ok]).T
+    return x1, y1, x2, y2, errors
+
+
+def run_method(method, L=10, iterations=5, seed=None):
+    """Run one method for `iterations` steps and return its statistics, without printing.
+
+    All iterations are drawn at once by the method's NumPy batch twin from
+    vector_samplers, with its own np.random.default_rng(seed) (`seed` may be
+    an int or a np.random.SeedSequence); methods without a batch twin fall
+    back to a per-iteration loop.
+
+    Returns a dict with keys all_valid, errors, edge_count, total_points,
+    first (the first pair and whether it is valid, or None) and ranges
+    ((x_min, x_max), (y_min, y_max), or None).
+    """
+    batch = BATCH_SAMPLERS.get(getattr(method, "__name__", None))
+    if batch is not None:
+        x1, y1, x2, y2 = batch(L, iterations, np.random.default_rng(seed))
+        errors = []
+    else:
+        x1, y1, x2, y2, errors = _sample_scalar(method, L, iterations)
+
+    first = None
+    if x1.size:
+        valid = (on_perimeter_batch(x1[0], y1[0], L) & on_perimeter_batch(x2[0], y2[0], L)
+                 & ((abs(x1[0] - x2[0]) > 1e-9) | (abs(y1[0] - y2[0]) > 1e-9)))
+        first = ((float(x1[0]), float(y1[0])), (float(x2[0]), float(y2[0])), bool(valid))
+
+    # Categorise points by edge (horizontal edges take priority at corners)
+    x = np.concatenate((x1, x2))
+    y = np.concatenate((y1, y2))
+    edge = np.select(
+        [np.abs(y) < 1e-9, np.abs(y - L) < 1e-9, np.abs(x) < 1e-9, np.abs(x - L) < 1e-9],
+        [0, 1, 2, 3], default=4,
+    )
+    counts = np.bincount(edge, minlength=5)
+
+    ranges = None
+    if x1.size:
+        ranges = ((float(min(x1.min(), x2.min())), float(max(x1.max(), x2.max()))),
+                  (float(min(y1.min(), y2.min())), float(max(y1.max(), y2.max()))))
+
+    return {
+        "all_valid":    not errors,
+        "errors":       errors,
+        "edge_count":   {e: int(c) for e, c in zip(EDGES, counts)},
+        "total_points": iterations * 2,
+        "first":        first,
+        "ranges":       ranges,
+    }
 
 
-def test_method(method, method_name, L=10, iterations=5):
-    """Run one method for `iterations` steps and print results and statistics."""
+def print_method_results(method_name, data, iterations):
+    """Print the per-method section for a run_method result."""
     print(f"\n{'='*60}")
     print(f"{method_name}")
     print(f"{'='*60}")
 
-    all_points = []
-    edge_count = {"bottom": 0, "top": 0, "left": 0, "right": 0}
-    all_valid = True
+    for error in data["errors"]:
+        print(f"[!] {error}")
 
-    for i in range(iterations):
-        try:
-            p1, p2 = method(L)
-            all_points.extend([p1, p2])
-
-            valid_p1 = verify_on_perimeter(p1, L)
-            valid_p2 = verify_on_perimeter(p2, L)
-            distinct = abs(p1[0] - p2[0]) > 1e-9 or abs(p1[1] - p2[1]) > 1e-9
-
-            # Categorise points by edge (horizontal edges take priority at corners)
-            for p in [p1, p2]:
-                x, y = p
-                if abs(y) < 1e-9:
-                    edge_count["bottom"] += 1
-                elif abs(y - L) < 1e-9:
-                    edge_count["top"] += 1
-                elif abs(x) < 1e-9:
-                    edge_count["left"] += 1
-                elif abs(x - L) < 1e-9:
-                    edge_count["right"] += 1
-
-            status = "[OK]" if (valid_p1 and valid_p2 and distinct) else "[!]"
-            if i == 0:
-                print(f"{status} Iteration {i+1}:")
-                print_points(p1, p2)
-            elif i == 1:
-                print(f"... ({iterations - 2} more iterations)")
-
-        except Exception as e:
-            print(f"[!] Iteration {i+1}: ERROR - {e}")
-            all_valid = False
+    if data["first"] is not None:
+        p1, p2, valid = data["first"]
+        status = "[OK]" if valid else "[!]"
+        print(f"{status} Iteration 1:")
+        print_points(p1, p2)
+        if iterations > 1:
+            print(f"... ({iterations - 2} more iterations)")
 
     # Statistics
-    print(f"\n--- Statistics ({iterations} iterations, {iterations*2} total points) ---")
-    total_points = iterations * 2
+    total_points = data["total_points"]
+    print(f"\n--- Statistics ({iterations} iterations, {total_points} total points) ---")
     print("Edge distribution:")
-    for edge, count in edge_count.items():
+    for edge_name, count in data["edge_count"].items():
         pct = (count / total_points * 100) if total_points > 0 else 0
         bar = "#" * int(pct / 5)
-        print(f"  {edge:>6}: {count:2d} points ({pct:5.1f}%) {bar}")
+        print(f"  {edge_name:>6}: {count:2d} points ({pct:5.1f}%) {bar}")
 
-    if all_points:
-        x_coords = [p[0] for p in all_points]
-        y_coords = [p[1] for p in all_points]
+    if data["ranges"] is not None:
+        (x_min, x_max), (y_min, y_max) = data["ranges"]
         print("Coordinate ranges:")
-        print(f"  X: [{min(x_coords):.4f}, {max(x_coords):.4f}]")
-        print(f"  Y: [{min(y_coords):.4f}, {max(y_coords):.4f}]")
+        print(f"  X: [{x_min:.4f}, {x_max:.4f}]")
+        print(f"  Y: [{y_min:.4f}, {y_max:.4f}]")
+
 
-    return all_valid, edge_count, total_points
+def test_method(method, method_name, L=10, iterations=5):
+    """Run one method for `iterations` steps and print results and statistics."""
+    data = run_method(method, L, iterations)
+    print_method_results(method_name, data, iterations)
+    return data["all_valid"], data["edge_count"], data["total_points"]
 
 
 def print_comparative_report(results_data):
     """Print a comparative table and category analysis across all methods."""
+    # Edge percentages (bottom, top, left, right) of each method, computed once
+    pcts = {
+        name: (np.array([edge_count[e] for e in EDGES]) / total_points * 100
+               if total_points > 0 else np.zeros(len(EDGES)))
+        for name, (_, edge_count, total_points) in results_data.items()
+    }
+
     print("\n\n" + "="*80)
     print("COMPARATIVE ANALYSIS")
     print("="*80)
@@ -108,11 +178,7 @@ def print_comparative_report(results_data):
     print(f"\n{'Method':<45} | {'Bottom':<8} {'Top':<8} {'Left':<8} {'Right':<8}")
     print("-" * 80)
 
-    for method_name, (_, edge_count, total_points) in results_data.items():
-        bottom_pct = (edge_count["bottom"] / total_points * 100) if total_points > 0 else 0
-        top_pct    = (edge_count["top"]    / total_points * 100) if total_points > 0 else 0
-        left_pct   = (edge_count["left"]   / total_points * 100) if total_points > 0 else 0
-        right_pct  = (edge_count["right"]  / total_points * 100) if total_points > 0 else 0
+    for method_name, (bottom_pct, top_pct, left_pct, right_pct) in pcts.items():
         print(f"{method_name:<45} | {bottom_pct:>6.1f}% {top_pct:>6.1f}% {left_pct:>6.1f}% {right_pct:>6.1f}%")
 
     print("\n" + "-" * 80)
@@ -123,43 +189,19 @@ def print_comparative_report(results_data):
     print("CATEGORY ANALYSIS")
     print("="*80)
 
-    categories = {
-        "Uniform on perimeter": [
-            "1. Parametric",
-            "2. Side Selection",
-            "3. Edge Label",
-            "5. Side + Position",
-            "6. Parametric (Modular)",
-            "7. Cartesian",
-        ],
-        "Uniform polar angle (non-uniform perimeter)": [
-            "4. Polar Ray",
-            "8. Polar Angle",
-        ],
-        "Interior projection (non-uniform)": [
-            "9. Interior Projection",
-        ],
-    }
+    name_to_cat = {name: category for category, names in CATEGORIES.items() for name in names}
+    members = {category: [] for category in CATEGORIES}
+    for method_name, pct in pcts.items():
+        if method_name in name_to_cat:
+            members[name_to_cat[method_name]].append(pct)
 
-    for category, method_names in categories.items():
+    for category, category_pcts in members.items():
         print(f"\n[{category}]")
         print("-" * 80)
 
-        total_bottom = total_top = total_left = total_right = count = 0
-
-        for method_name, (_, edge_count, total_points) in results_data.items():
-            if any(m in method_name for m in method_names):
-                total_bottom += edge_count["bottom"] / total_points * 100
-                total_top    += edge_count["top"]    / total_points * 100
-                total_left   += edge_count["left"]   / total_points * 100
-                total_right  += edge_count["right"]  / total_points * 100
-                count += 1
-
+        count = len(category_pcts)
         if count > 0:
-            avg_b = total_bottom / count
-            avg_t = total_top    / count
-            avg_l = total_left   / count
-            avg_r = total_right  / count
+            avg_b, avg_t, avg_l, avg_r = np.mean(category_pcts, axis=0)
 
             print(f"Average distribution across {count} method(s):")
             print(f"  Bottom: {avg_b:6.1f}%  Top: {avg_t:6.1f}%  Left: {avg_l:6.1f}%  Right: {avg_r:6.1f}%")
@@ -242,17 +284,22 @@ def main():
         (sample_interior_projection, "9. Interior Projection"),
     ]
 
+    # Each method is a sub-millisecond batch run: a process pool costs far
+    # more to start than it saves, so they run in sequence.
+    method_results = [run_method(method, L, iterations) for method, _ in methods]
+
     results = {}
     results_data = {}
 
-    for method, name in methods:
+    for (_, name), data in zip(methods, method_results):
         if name in method_descriptions:
             print(f"\n{'-'*60}")
             print(f"Description: {method_descriptions[name]}")
 
-        passed, edge_count, total_points = test_method(method, name, L=L, iterations=iterations)
+        print_method_results(name, data, iterations)
+        passed = data["all_valid"]
         results[name] = passed
-        results_data[name] = (passed, edge_count, total_points)
+        results_data[name] = (passed, data["edge_count"], data["total_points"])
 
     # Summary
     print("\n" + "="*60)
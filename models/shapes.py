@@ -7,6 +7,8 @@ Geometric models used throughout the project.
 import math
 from typing import Tuple
 
+from utils.helpers import is_on_perimeter
+
 Point = Tuple[float, float]
 
 
@@ -14,35 +16,34 @@ class Square:
     """Axis-aligned square [0, L] × [0, L].
 
     Attributes:
-        L: side length (must be positive)
+        L:         side length (must be positive)
+        perimeter: total perimeter length
+        area:      area of the square
+        diagonal:  length of the diagonal (= maximum possible distance between two perimeter points)
+        center:    center point of the square
+
+    The derived attributes are computed once, in __init__, and stored in
+    slots. A Square is immutable: assigning or deleting any attribute
+    raises AttributeError, so the derived values cannot go stale.
     """
 
+    __slots__ = ("L", "perimeter", "area", "diagonal", "center")
+
     def __init__(self, L: float) -> None:
         if L <= 0:
             raise ValueError(f"Side length must be positive, got {L}")
-        self.L = L
-
-    # ── Geometry ──────────────────────────────────────────────────────────────
-
-    @property
-    def perimeter(self) -> float:
-        """Total perimeter length."""
-        return 4 * self.L
+        _set = object.__setattr__
+        _set(self, "L", L)
+        _set(self, "perimeter", 4 * L)
+        _set(self, "area", L * L)
+        _set(self, "diagonal", L * math.sqrt(2))
+        _set(self, "center", (L / 2, L / 2))
 
-    @property
-    def area(self) -> float:
-        """Area of the square."""
-        return self.L ** 2
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Square is immutable: cannot set {name!r}")
 
-    @property
-    def diagonal(self) -> float:
-        """Length of the diagonal (= maximum possible distance between two perimeter points)."""
-        return self.L * math.sqrt(2)
-
-    @property
-    def center(self) -> Point:
-        """Center point of the square."""
-        return (self.L / 2, self.L / 2)
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Square is immutable: cannot delete {name!r}")
 
     # ── Predicates ────────────────────────────────────────────────────────────
 
@@ -52,13 +53,8 @@ class Square:
         return -tol <= x <= self.L + tol and -tol <= y <= self.L + tol
 
     def on_perimeter(self, point: Point, tol: float = 1e-9) -> bool:
-        """Return True if the point lies on the perimeter of the square."""
-        x, y = point
-        on_bottom = abs(y) < tol       and 0 <= x <= self.L
-        on_top    = abs(y - self.L) < tol and 0 <= x <= self.L
-        on_left   = abs(x) < tol       and 0 <= y <= self.L
-        on_right  = abs(x - self.L) < tol and 0 <= y <= self.L
-        return on_bottom or on_top or on_left or on_right
+        """Return True if the point lies on the perimeter of the square (see utils.helpers)."""
+        return is_on_perimeter(point, self.L, tol)
 
     # ── Distance ──────────────────────────────────────────────────────────────
 
@@ -67,6 +63,13 @@ class Square:
         """Euclidean distance between two points."""
         return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
 
+    @staticmethod
+    def distance_sq(p1: Point, p2: Point) -> float:
+        """Squared Euclidean distance; compare with L**2 to avoid the sqrt."""
+        dx = p1[0] - p2[0]
+        dy = p1[1] - p2[1]
+        return dx * dx + dy * dy
+
     # ── Dunder ────────────────────────────────────────────────────────────────
 
     def __repr__(self) -> str:
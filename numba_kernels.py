@@ -0,0 +1,214 @@
+"""
+numba_kernels.py
+================
+Numba-compiled scalar versions of the 9 sampling methods and a fused
+sampling + distance loop for distance_analysis.py.
+
+Numba is an optional dependency (`pip install numba`). Without it the
+decorators below are no-ops: the kernels still run, as plain Python, and
+HAVE_NUMBA is False so callers can prefer the NumPy batch path instead.
+
+Every sampler returns the pair as four floats (x1, y1, x2, y2). Methods are
+identified by the integer ids in METHOD_IDS.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# Kernel id of each scalar method, keyed by the square_points function name.
+METHOD_IDS = {
+    "sample_parametric":          0,
+    "sample_by_side":             1,
+    "sample_by_edge_label":       2,
+    "sample_polar_ray":           3,
+    "sample_side_pos":            4,
+    "sample_parametric_modular":  5,
+    "sample_cartesian":           6,
+    "sample_polar_angle":         7,
+    "sample_interior_projection": 8,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# POINT MAPPINGS
+# ─────────────────────────────────────────────────────────────────────────────
+
+@njit(cache=True, fastmath=True)
+def _perimeter_to_xy(t, L):
+    """Map t ∈ [0, 4L) to the boundary, counter-clockwise from (0, 0)."""
+    if t < L:
+        return t, 0.0
+    elif t < 2 * L:
+        return L, t - L
+    elif t < 3 * L:
+        return 3 * L - t, L
+    return 0.0, 4 * L - t
+
+
+@njit(cache=True, fastmath=True)
+def _side_to_xy(side, s, L):
+    """Map (side index, position) to (x, y); sides are 0=bottom, 1=top, 2=left, 3=right."""
+    if side == 0:
+        return s, 0.0
+    elif side == 1:
+        return s, L
+    elif side == 2:
+        return 0.0, s
+    return L, s
+
+
+@njit(cache=True, fastmath=True)
+def _angle_to_xy(theta, L):
+    """Boundary point hit by the ray from the center at polar angle theta."""
+    half = 0.5 * L
+    c = math.cos(theta)
+    s = math.sin(theta)
+    scale = half / max(abs(c), abs(s))
+    x = min(L, max(0.0, half + c * scale))
+    y = min(L, max(0.0, half + s * scale))
+    return x, y
+
+
+@njit(cache=True, fastmath=True)
+def _project_to_border(x, y, L):
+    """Project an interior point onto the nearest side (horizontal sides win ties)."""
+    if min(y, L - y) <= min(x, L - x):
+        return x, (0.0 if y <= L - y else L)
+    return (0.0 if x <= L - x else L), y
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SAMPLERS
+# ─────────────────────────────────────────────────────────────────────────────
+
+@njit(cache=True, fastmath=True)
+def sample_parametric_nb(L):
+    x1, y1 = _perimeter_to_xy(np.random.random() * 4 * L, L)
+    x2, y2 = _perimeter_to_xy(np.random.random() * 4 * L, L)
+    return x1, y1, x2, y2
+
+
+@njit(cache=True, fastmath=True)
+def sample_by_side_nb(L):
+    x1, y1 = _side_to_xy(int(np.random.random() * 4), np.random.random() * L, L)
+    x2, y2 = _side_to_xy(int(np.random.random() * 4), np.random.random() * L, L)
+    return x1, y1, x2, y2
+
+
+@njit(cache=True, fastmath=True)
+def sample_polar_angle_nb(L):
+    x1, y1 = _angle_to_xy(np.random.random() * 2 * math.pi, L)
+    x2, y2 = _angle_to_xy(np.random.random() * 2 * math.pi, L)
+    return x1, y1, x2, y2
+
+
+@njit(cache=True, fastmath=True)
+def _cartesian_point(L):
+    wall = L if np.random.random() < 0.5 else 0.0
+    if np.random.random() < 0.5:
+        return wall, np.random.random() * L
+    return np.random.random() * L, wall
+
+
+@njit(cache=True, fastmath=True)
+def sample_cartesian_nb(L):
+    x1, y1 = _cartesian_point(L)
+    x2, y2 = _cartesian_point(L)
+    return x1, y1, x2, y2
+
+
+@njit(cache=True, fastmath=True)
+def sample_interior_projection_nb(L):
+    x1, y1 = _project_to_border(np.random.random() * L, np.random.random() * L, L)
+    x2, y2 = _project_to_border(np.random.random() * L, np.random.random() * L, L)
+    return x1, y1, x2, y2
+
+
+@njit(cache=True, fastmath=True)
+def sample_method_nb(method, L):
+    """Dispatch to the sampler with the given METHOD_IDS id."""
+    if method == 0 or method == 5:
+        return sample_parametric_nb(L)
+    elif method == 1 or method == 2 or method == 4:
+        return sample_by_side_nb(L)
+    elif method == 3 or method == 7:
+        return sample_polar_angle_nb(L)
+    elif method == 6:
+        return sample_cartesian_nb(L)
+    return sample_interior_projection_nb(L)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DRIVERS
+# ─────────────────────────────────────────────────────────────────────────────
+
+@njit(cache=True, fastmath=True, parallel=True)
+def count_hits_nb(L, n, method):
+    """Number of the n pairs drawn with `method` whose distance exceeds L.
+
+    Sampling, distance and comparison are fused in one prange loop; `hits`
+    is a parallel sum reduction. The squared distance is compared with L².
+    """
+    L2 = L * L
+    hits = 0
+    for i in prange(n):
+        x1, y1, x2, y2 = sample_method_nb(method, L)
+        dx = x1 - x2
+        dy = y1 - y2
+        if dx * dx + dy * dy > L2:
+            hits += 1
+    return hits
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def run_all_nb(L, iterations, methods):
+    """Fused loop behind distance_analysis.run_all.
+
+    `methods` is an int array of METHOD_IDS. Returns the
+    (len(methods), iterations) distance matrix and the min/max win counters.
+    Iterations are independent and run in parallel with prange; each thread
+    draws from its own random stream. The index of the shortest/longest
+    method is stored per iteration and counted after the parallel loop, so
+    threads never write to the same counter.
+    """
+    k = methods.shape[0]
+    distances = np.empty((k, iterations))
+    imins = np.empty(iterations, dtype=np.int64)
+    imaxs = np.empty(iterations, dtype=np.int64)
+    for i in prange(iterations):
+        imin = 0
+        imax = 0
+        for m in range(k):
+            x1, y1, x2, y2 = sample_method_nb(methods[m], L)
+            dx = x1 - x2
+            dy = y1 - y2
+            d = math.sqrt(dx * dx + dy * dy)
+            distances[m, i] = d
+            if d < distances[imin, i]:
+                imin = m
+            if d > distances[imax, i]:
+                imax = m
+        imins[i] = imin
+        imaxs[i] = imax
+
+    min_wins = np.zeros(k, dtype=np.int64)
+    max_wins = np.zeros(k, dtype=np.int64)
+    for i in range(iterations):
+        min_wins[imins[i]] += 1
+        max_wins[imaxs[i]] += 1
+    return distances, min_wins, max_wins
@@ -1,4 +1,14 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+# Optional C kernels (_square_core.pyx); built only if Cython is installed.
+# The Extension names the module explicitly: the repo root has an __init__.py,
+# so cythonize would otherwise call it <dirname>._square_core.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize([Extension("_square_core", ["_square_core.pyx"])], language_level=3)
 
 setup(
     name="geometry",
@@ -9,8 +19,11 @@ setup(
     packages=find_packages(exclude=["tests*", ".venv*"]),
     install_requires=[
         "colorama>=0.4.6",
+        "numpy>=1.17",
     ],
     extras_require={
         "dev": ["pytest>=7.0"],
+        "fast": ["numba>=0.57"],
     },
+    ext_modules=ext_modules,
 )
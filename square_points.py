@@ -1,8 +1,10 @@
 """
 square_points.py
 ================
-Collection of 5 methods (+3 variants) for sampling two distinct random points
-on the perimeter of a square with side length L.
+Collection of 5 methods (+3 variants) for sampling two independent random
+points on the perimeter of a square with side length L, and bulk generators
+(iter_sample_*) that yield a stream of n such pairs. The two points are not
+forced to differ (see "Note on distinctness" below).
 
 Bug fixes compared to the original version
 -------------------------------------------
@@ -14,21 +16,35 @@ Bug fixes compared to the original version
   The correct check is whether the resulting POINTS are distinct,
   not whether the sides are different.
 
-Note on sample_side_pos (original: metodo5)
---------------------------------------------
-The condition `while side1 == side2 and abs(s1 - s2) < 1e-12` is
-logically correct (the points are identical iff same side AND same
-position), but uses a very tight threshold (1e-12). In practice,
-with `random.uniform` an exact collision is virtually impossible,
-so the loop almost never retries. The condition has been kept unchanged
-but is documented here.
+Note on distinctness
+--------------------
+The samplers no longer retry until the two points differ. Every method
+draws continuous uniforms (doubles with 53 random bits), so the two points
+coincide with probability ~2^-53 per pair: the retry loops (including the
+`while side1 == side2 and abs(s1 - s2) < 1e-12` of sample_side_pos,
+original: metodo5) were dead code that still cost a comparison on every
+call. A collision can only come from a deliberately seeded or mocked
+generator; callers that need a hard guarantee can check the result once
+with _is_distinct.
 """
 
 import random
 import math
-from typing import Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
 Point = Tuple[float, float]
+# A random.Random, or a numpy.random.Generator (random() plus integers()).
+Rng = Any
+
+# Bound once at module level so the samplers skip the `random.` attribute lookup.
+# The samplers further bind these (and the other callables they use) as
+# default arguments, which makes them fast locals inside the function body.
+# Every sampler also takes an optional `rng` (a random.Random instance, a
+# numpy Generator or a UniformPool, see _bind_rng) that replaces the
+# module-level generator, e.g. one seeded instance per worker or per test
+# session.
+_rand = random.random
+_bits = random.getrandbits
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -51,9 +67,54 @@ def _perimeter_to_xy(t: float, L: float) -> Point:
     elif t < 2 * L:
         return (L, t - L)
     elif t < 3 * L:
-        return (L - (t - 2 * L), L)
+        return (3 * L - t, L)
     else:
-        return (0.0, L - (t - 3 * L))
+        return (0.0, 4 * L - t)   # also t % 4L rounded up to 4L, e.g. tiny t < 0
+
+
+def _angle_to_xy(theta: float, L: float, half: float,
+                 _cos=math.cos, _sin=math.sin) -> Point:
+    """Boundary point hit by the ray from the center at polar angle theta.
+
+    `half` is L / 2 (also the center coordinate), passed in by callers that
+    map many angles with the same L.
+    """
+    cos_t, sin_t = _cos(theta), _sin(theta)
+    # The wall pair hit first is the one the ray is more aligned with
+    scale = half / max(abs(cos_t), abs(sin_t))
+    x = max(0.0, min(L, half + cos_t * scale))
+    y = max(0.0, min(L, half + sin_t * scale))
+    return (x, y)
+
+
+def _bind_rng(rng: Rng) -> Tuple[Callable[[], float], Callable[[int], int]]:
+    """Return the (random, getrandbits) pair the samplers use, drawn from rng.
+
+    A numpy Generator has no getrandbits; k bits are drawn as integers(2**k).
+    """
+    if hasattr(rng, "getrandbits"):
+        return rng.random, rng.getrandbits
+    integers = rng.integers
+    return rng.random, lambda k: int(integers(1 << k))
+
+
+class UniformPool:
+    """rng stand-in that replays a pre-drawn sequence of uniforms in [0, 1).
+
+    Pass it as the `rng` of any sampler to feed it from one bulk draw, e.g.
+    UniformPool(np.random.default_rng(seed).random(4 * n).tolist()) for n
+    calls (no sampler uses more than 4 uniforms per pair). random() is the
+    C-level __next__ of an iterator over the pool; getrandbits(k) consumes
+    one uniform. Raises StopIteration once the pool is exhausted.
+    """
+
+    __slots__ = ("random",)
+
+    def __init__(self, uniforms: Iterable[float]) -> None:
+        self.random = iter(uniforms).__next__
+
+    def getrandbits(self, k: int) -> int:
+        return int(self.random() * (1 << k))
 
 
 def _is_distinct(p1: Point, p2: Point, tol: float = 1e-12) -> bool:
@@ -61,151 +122,146 @@ def _is_distinct(p1: Point, p2: Point, tol: float = 1e-12) -> bool:
     return abs(p1[0] - p2[0]) > tol or abs(p1[1] - p2[1]) > tol
 
 
+def _is_distinct_fast(p1: Point, p2: Point) -> bool:
+    """Exact-inequality version of _is_distinct, for points from independent draws.
+
+    A plain tuple comparison: no tolerance, so only use it where a near
+    coincidence is not itself something to detect.
+    """
+    return p1 != p2
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # ORIGINAL METHODS (1-5)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def sample_parametric(L: float) -> Tuple[Point, Point]:
+def sample_parametric(L: float, rng: Optional[Rng] = None,
+                      _rand=_rand) -> Tuple[Point, Point]:
     """Linear parametrization of the perimeter.
 
-    Unrolls the perimeter into [0, 4L) and samples two distinct values t,
+    Unrolls the perimeter into [0, 4L) and samples two values t,
     then converts them to (x, y) coordinates.
     Distribution: uniform on the perimeter.
     """
+    if rng is not None:
+        _rand = rng.random
+
     def point(t: float) -> Point:
         if t < L:        return (t, 0.0)          # bottom side
         elif t < 2 * L:  return (L, t - L)         # right side
         elif t < 3 * L:  return (3 * L - t, L)     # top side
         else:            return (0.0, 4 * L - t)   # left side
 
-    t1 = random.uniform(0, 4 * L)
-    t2 = random.uniform(0, 4 * L)
-    while abs(t1 - t2) < 1e-12:
-        t2 = random.uniform(0, 4 * L)
+    four_L = 4 * L
+    t1 = _rand() * four_L
+    t2 = _rand() * four_L
     return point(t1), point(t2)
 
 
-def sample_by_side(L: float) -> Tuple[Point, Point]:
+def sample_by_side(L: float, rng: Optional[Rng] = None,
+                   _rand=_rand, _bits=_bits) -> Tuple[Point, Point]:
     """Side selection + uniform position on the chosen side.
 
     For each point: picks one of the 4 sides at random, then a uniform
-    position s ∈ [0, L] on that side. Retries until the two points are
-    distinct (they may land on the same side).
+    position s ∈ [0, L] on that side (the two points may land on the
+    same side).
     Distribution: uniform on the perimeter.
 
     FIX: the original version used `while side1 == side2` (forcing different
-    sides), which excluded 25% of valid pairs. The condition now correctly
-    checks the geometric distinctness of the resulting points.
+    sides), which excluded 25% of valid pairs. Both points are now drawn
+    independently.
     """
-    SIDES = ["bottom", "top", "left", "right"]
-
-    def choose_point(side: str) -> Point:
-        s = random.uniform(0, L)
-        if side == "bottom": return (s, 0.0)
-        if side == "top":    return (s, L)
-        if side == "left":   return (0.0, s)
-        return (L, s)   # right
-
-    p1 = choose_point(random.choice(SIDES))
-    p2 = choose_point(random.choice(SIDES))
-    while not _is_distinct(p1, p2):
-        p2 = choose_point(random.choice(SIDES))
+    if rng is not None:
+        _rand, _bits = _bind_rng(rng)
+
+    def choose_point() -> Point:
+        s = _rand() * L
+        side = _bits(2)   # 0=bottom, 1=top, 2=left, 3=right
+        if side == 0: return (s, 0.0)
+        if side == 1: return (s, L)
+        if side == 2: return (0.0, s)
+        return (L, s)
+
+    p1 = choose_point()
+    p2 = choose_point()
     return p1, p2
 
 
-def sample_by_edge_label(L: float) -> Tuple[Point, Point]:
+def sample_by_edge_label(L: float, rng: Optional[Rng] = None,
+                         _rand=_rand, _bits=_bits) -> Tuple[Point, Point]:
     """Edge labels (x0, xL, y0, yL).
 
     Each point is identified by an edge label ("x0", "xL", "y0", "yL") and
-    a uniform position on that edge. Retries until the resulting points
-    are distinct.
+    a uniform position on that edge.
     Distribution: uniform on the perimeter.
     """
-    EDGES = ["x0", "xL", "y0", "yL"]
-
-    def point(edge: str) -> Point:
-        s = random.uniform(0, L)
-        if edge == "x0": return (0.0, s)
-        if edge == "xL": return (L, s)
-        if edge == "y0": return (s, 0.0)
-        return (s, L)   # yL
-
-    p1 = point(random.choice(EDGES))
-    p2 = point(random.choice(EDGES))
-    while not _is_distinct(p1, p2):
-        p2 = point(random.choice(EDGES))
+    if rng is not None:
+        _rand, _bits = _bind_rng(rng)
+
+    def point() -> Point:
+        s = _rand() * L
+        edge = _bits(2)   # 0="x0", 1="xL", 2="y0", 3="yL"
+        if edge == 0: return (0.0, s)
+        if edge == 1: return (L, s)
+        if edge == 2: return (s, 0.0)
+        return (s, L)
+
+    p1 = point()
+    p2 = point()
     return p1, p2
 
 
-def sample_polar_ray(L: float) -> Tuple[Point, Point]:
+def sample_polar_ray(L: float, rng: Optional[Rng] = None,
+                     _rand=_rand, _cos=math.cos, _sin=math.sin,
+                     _two_pi=2 * math.pi) -> Tuple[Point, Point]:
     """Ray intersections from the center of the square.
 
     Samples two angles θ ∈ [0, 2π) and traces a ray from the center
-    (L/2, L/2) to the boundary for each, computing the exact intersection
-    with each of the four walls.
+    (L/2, L/2) to the boundary for each: the ray leaves the square through
+    whichever wall, vertical or horizontal, it reaches first.
     Distribution: uniform over angles (not over the perimeter).
     """
+    if rng is not None:
+        _rand = rng.random
+
     cx, cy = L / 2, L / 2
 
     def intersection(theta: float) -> Point:
-        dx, dy = math.cos(theta), math.sin(theta)
-        candidates = []
-
-        if dx != 0:
-            for xw in (0.0, L):
-                t = (xw - cx) / dx
-                y = cy + t * dy
-                if t > 0 and 0 <= y <= L:
-                    candidates.append((t, (xw, y)))
-        if dy != 0:
-            for yw in (0.0, L):
-                t = (yw - cy) / dy
-                x = cx + t * dx
-                if t > 0 and 0 <= x <= L:
-                    candidates.append((t, (x, yw)))
-
-        if not candidates:
-            # Degenerate case (should never occur with random angles)
-            return (cx, 0.0)
-        return min(candidates)[1]
-
-    t1 = random.uniform(0, 2 * math.pi)
-    t2 = random.uniform(0, 2 * math.pi)
-    while abs(t1 - t2) < 1e-12:
-        t2 = random.uniform(0, 2 * math.pi)
+        dx, dy = _cos(theta), _sin(theta)
+        # Ray parameter at which the ray reaches the nearest vertical wall
+        # (x = 0 or L) and the nearest horizontal wall (y = 0 or L).
+        tx = cx / abs(dx) if dx != 0 else math.inf
+        ty = cy / abs(dy) if dy != 0 else math.inf
+        if tx <= ty:
+            return ((L if dx > 0 else 0.0), max(0.0, min(L, cy + tx * dy)))
+        return (max(0.0, min(L, cx + ty * dx)), (L if dy > 0 else 0.0))
+
+    t1 = _rand() * _two_pi
+    t2 = _rand() * _two_pi
     return intersection(t1), intersection(t2)
 
 
-def sample_side_pos(L: float) -> Tuple[Point, Point]:
-    """Side selection + position, with distinctness check.
+def sample_side_pos(L: float, rng: Optional[Rng] = None,
+                    _rand=_rand, _bits=_bits) -> Tuple[Point, Point]:
+    """Side selection + position.
 
-    Similar to sample_by_side but the (side, position) pair is generated
-    in a single step. The while loop retries only when both the side and
-    the position are practically identical (the points coincide).
+    Similar to sample_by_side but both (side, position) pairs are generated
+    up front and mapped to points in a single step.
     Distribution: uniform on the perimeter.
-
-    Note: `while side1 == side2 and abs(s1 - s2) < 1e-12` is logically
-    equivalent to checking that the points are not identical, but uses a
-    very tight threshold; it works correctly in floating point because two
-    independent `random.uniform` calls rarely produce the same value.
     """
-    SIDES = ["bottom", "top", "left", "right"]
-
-    def point(side: str, s: float) -> Point:
-        if side == "bottom": return (s, 0.0)
-        if side == "top":    return (s, L)
-        if side == "left":   return (0.0, s)
-        return (L, s)   # right
-
-    side1 = random.choice(SIDES)
-    side2 = random.choice(SIDES)
-    s1 = random.uniform(0, L)
-    s2 = random.uniform(0, L)
-
-    while side1 == side2 and abs(s1 - s2) < 1e-12:
-        side2 = random.choice(SIDES)
-        s2 = random.uniform(0, L)
-
+    if rng is not None:
+        _rand, _bits = _bind_rng(rng)
+
+    def point(side: int, s: float) -> Point:
+        if side == 0: return (s, 0.0)   # bottom
+        if side == 1: return (s, L)     # top
+        if side == 2: return (0.0, s)   # left
+        return (L, s)                   # right
+
+    side1 = _bits(2)
+    side2 = _bits(2)
+    s1 = _rand() * L
+    s2 = _rand() * L
     return point(side1, s1), point(side2, s2)
 
 
@@ -213,97 +269,173 @@ def sample_side_pos(L: float) -> Tuple[Point, Point]:
 # VARIANTS / IMPROVED VERSIONS
 # ─────────────────────────────────────────────────────────────────────────────
 
-def sample_parametric_modular(L: float) -> Tuple[Point, Point]:
+def sample_parametric_modular(L: float, rng: Optional[Rng] = None,
+                              _rand=_rand, _to_xy=_perimeter_to_xy) -> Tuple[Point, Point]:
     """Linear parametrization of the perimeter (modular version).
 
     Identical to sample_parametric but uses the helper function
     _perimeter_to_xy for better readability and reuse.
     Distribution: uniform on the perimeter.
     """
-    t1 = random.uniform(0, 4 * L)
-    t2 = random.uniform(0, 4 * L)
-    while abs(t1 - t2) < 1e-12:
-        t2 = random.uniform(0, 4 * L)
-    return _perimeter_to_xy(t1, L), _perimeter_to_xy(t2, L)
+    if rng is not None:
+        _rand = rng.random
 
+    four_L = 4 * L
+    t1 = _rand() * four_L
+    t2 = _rand() * four_L
+    return _to_xy(t1, L), _to_xy(t2, L)
 
-def sample_cartesian(L: float) -> Tuple[Point, Point]:
+
+def sample_cartesian(L: float, rng: Optional[Rng] = None,
+                     _rand=_rand, _bits=_bits) -> Tuple[Point, Point]:
     """Cartesian coordinates with boundary constraint.
 
     For each point: randomly decides whether to fix x or y, then fixes
     that coordinate to 0 or L and samples the other uniformly in [0, L].
+    Both choices come from a single 2-bit draw.
     Distribution: quasi-uniform (slight over-representation of sides
     compared to corners).
     """
+    if rng is not None:
+        _rand, _bits = _bind_rng(rng)
+
     def pick_point() -> Point:
-        if random.random() < 0.5:
-            return (random.choice([0.0, L]), random.uniform(0, L))  # fix x
-        else:
-            return (random.uniform(0, L), random.choice([0.0, L]))  # fix y
+        k = _bits(2)   # 0: x=0, 1: x=L, 2: y=0, 3: y=L
+        u = _rand() * L
+        if k == 0: return (0.0, u)
+        if k == 1: return (L, u)
+        if k == 2: return (u, 0.0)
+        return (u, L)
 
     p1 = pick_point()
     p2 = pick_point()
-    while not _is_distinct(p1, p2):
-        p2 = pick_point()
     return p1, p2
 
 
-def sample_polar_angle(L: float) -> Tuple[Point, Point]:
+def make_polar_sampler(L: float, rng: Optional[Rng] = None) -> Callable[[], Tuple[Point, Point]]:
+    """Return a zero-argument sample_polar_angle specialized for a fixed L.
+
+    The constants derived from L (center, 2π) are computed once, when the
+    sampler is built; call the returned function in a loop instead of
+    sample_polar_angle(L) when sampling many pairs with the same L.
+    """
+    half = L / 2               # also the center coordinate cx = cy
+    two_pi = 2 * math.pi
+    rand = _rand if rng is None else rng.random
+
+    def sampler(to_xy=_angle_to_xy) -> Tuple[Point, Point]:
+        theta1 = rand() * two_pi
+        theta2 = rand() * two_pi
+        return to_xy(theta1, L, half), to_xy(theta2, L, half)
+
+    return sampler
+
+
+def sample_polar_angle(L: float, rng: Optional[Rng] = None,
+                       _rand=_rand, _to_xy=_angle_to_xy,
+                       _two_pi=2 * math.pi) -> Tuple[Point, Point]:
     """Polar angle from the center (simplified and robust version).
 
     Samples two angles θ ∈ [0, 2π) and computes the boundary point using
     the ratio between |cos θ| and |sin θ|, without explicitly searching
     for intersections with all four walls.
     Distribution: uniform over angles (not over the perimeter).
+    See make_polar_sampler for a version specialized for a fixed L.
     """
-    def angle_to_point(theta: float) -> Point:
-        cx, cy = L / 2, L / 2
-        cos_t, sin_t = math.cos(theta), math.sin(theta)
-        half = L / 2
-        # Determine which pair of walls is intersected first
-        if abs(cos_t) >= abs(sin_t):
-            scale = half / abs(cos_t)
-        else:
-            scale = half / abs(sin_t)
-        x = max(0.0, min(L, cx + cos_t * scale))
-        y = max(0.0, min(L, cy + sin_t * scale))
-        return (x, y)
-
-    theta1 = random.uniform(0, 2 * math.pi)
-    theta2 = random.uniform(0, 2 * math.pi)
-    while abs(theta1 - theta2) < 1e-12:
-        theta2 = random.uniform(0, 2 * math.pi)
-    return angle_to_point(theta1), angle_to_point(theta2)
-
-
-def sample_interior_projection(L: float) -> Tuple[Point, Point]:
+    if rng is not None:
+        _rand = rng.random
+
+    half = L / 2               # also the center coordinate cx = cy
+    theta1 = _rand() * _two_pi
+    theta2 = _rand() * _two_pi
+    return _to_xy(theta1, L, half), _to_xy(theta2, L, half)
+
+
+def sample_interior_projection(L: float, rng: Optional[Rng] = None,
+                               _rand=_rand) -> Tuple[Point, Point]:
     """Rejection sampling + projection onto the nearest boundary side.
 
     Samples a random point in the interior [0, L]² and projects it onto
-    the nearest side of the square. Retries until the two resulting points
-    are distinct.
+    the nearest side of the square.
     Distribution: NOT uniform — the midpoints of each side receive a
     disproportionate number of projections (most interior points project
     there). Corners are under-represented.
     """
+    if rng is not None:
+        _rand = rng.random
+
     def project_to_border(x: float, y: float) -> Point:
-        d = {"bottom": y, "top": L - y, "left": x, "right": L - x}
-        nearest = min(d, key=d.get)
-        if nearest == "bottom": return (x, 0.0)
-        if nearest == "top":    return (x, L)
-        if nearest == "left":   return (0.0, y)
-        return (L, y)
+        # Nearest horizontal side vs nearest vertical side; ties go to
+        # bottom, top, left, right in that order.
+        if min(y, L - y) <= min(x, L - x):
+            return (x, 0.0 if y <= L - y else L)
+        return (0.0 if x <= L - x else L, y)
 
     def pick_point() -> Point:
-        return project_to_border(random.uniform(0, L), random.uniform(0, L))
+        return project_to_border(_rand() * L, _rand() * L)
 
     p1 = pick_point()
     p2 = pick_point()
-    while not _is_distinct(p1, p2):
-        p2 = pick_point()
     return p1, p2
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# BULK GENERATORS
+# Same distributions as the samplers above, for callers that want many pairs
+# through the scalar API: the random numbers are drawn in chunks of _CHUNK
+# pairs, with one list comprehension per chunk. They only call rng.random(),
+# so any rng the samplers accept (including a UniformPool) works here too; a
+# numpy Generator fills each chunk with a single rng.random(k) call.
+# ─────────────────────────────────────────────────────────────────────────────
+
+_CHUNK = 1024
+
+
+def _block_uniforms(rng: Optional[Rng]) -> Callable[[int], List[float]]:
+    """Return a function drawing k uniforms in [0, 1) from rng as a list.
+
+    A numpy Generator (no getrandbits, see _bind_rng) draws the block in one
+    call; random.Random and UniformPool are called once per uniform.
+    """
+    if rng is not None and not hasattr(rng, "getrandbits"):
+        block = rng.random
+        return lambda k: block(k).tolist()
+    rand = _rand if rng is None else rng.random
+    return lambda k: [rand() for _ in range(k)]
+
+
+def iter_sample_parametric(L: float, n: int,
+                           rng: Optional[Rng] = None) -> Iterator[Tuple[Point, Point]]:
+    """Yield n pairs distributed as sample_parametric (uniform on the perimeter)."""
+    four_L = 4 * L
+    to_xy = _perimeter_to_xy
+    draw = _block_uniforms(rng)
+    for start in range(0, n, _CHUNK):
+        m = min(_CHUNK, n - start)
+        ts = [u * four_L for u in draw(2 * m)]
+        for i in range(0, 2 * m, 2):
+            yield to_xy(ts[i], L), to_xy(ts[i + 1], L)
+
+
+def iter_sample_by_side(L: float, n: int,
+                        rng: Optional[Rng] = None) -> Iterator[Tuple[Point, Point]]:
+    """Yield n pairs distributed as sample_by_side (uniform on the perimeter)."""
+    draw = _block_uniforms(rng)
+
+    def point(side: int, s: float) -> Point:
+        if side == 0: return (s, 0.0)   # bottom
+        if side == 1: return (s, L)     # top
+        if side == 2: return (0.0, s)   # left
+        return (L, s)                   # right
+
+    for start in range(0, n, _CHUNK):
+        m = min(_CHUNK, n - start)
+        sides = [int(u * 4) for u in draw(2 * m)]
+        ss = [u * L for u in draw(2 * m)]
+        for i in range(0, 2 * m, 2):
+            yield point(sides[i], ss[i]), point(sides[i + 1], ss[i + 1])
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # DEMO
 # ─────────────────────────────────────────────────────────────────────────────
@@ -14,6 +14,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+import numpy as np
+
 from square_points import (
     sample_parametric,
     sample_by_side,
@@ -25,30 +27,57 @@ from square_points import (
     sample_polar_angle,
     sample_interior_projection,
 )
+from vector_samplers import BATCH_SAMPLERS
 
 L = 10
 ITERATIONS = 1000
+TOL = 1e-9
 
 
-def check_distribution(method, method_name: str):
-    """Run the method and print the edge distribution."""
-    edge_count = {"bottom": 0, "top": 0, "left": 0, "right": 0}
+def _scalar_pairs(method):
+    """Call the method ITERATIONS times and return its pairs as (x1, y1, x2, y2) arrays.
 
+    A call that raises is reported and its pair skipped.
+    """
+    rows = []
     for _ in range(ITERATIONS):
         try:
             p1, p2 = method(L)
-            for p in [p1, p2]:
-                x, y = p
-                if abs(y) < 1e-9:
-                    edge_count["bottom"] += 1
-                elif abs(y - L) < 1e-9:
-                    edge_count["top"] += 1
-                elif abs(x) < 1e-9:
-                    edge_count["left"] += 1
-                elif abs(x - L) < 1e-9:
-                    edge_count["right"] += 1
+            rows.append((*p1, *p2))
         except Exception as e:
             print(f"  ERROR: {e}")
+    return np.array(rows, dtype=float).reshape(-1, 4).T
+
+
+def check_distribution(method, method_name: str):
+    """Sample the method's batch twin and print the edge distribution.
+
+    Methods without a batch twin are called ITERATIONS times instead and
+    their pairs collected into the same arrays.
+
+    The ITERATIONS pairs are drawn as Structure-of-Arrays (x1, y1, x2, y2)
+    and classified with array operations; horizontal edges take priority
+    at the corners. The batch samplers keep every coordinate within
+    [0, L], so |c| < TOL and |c - L| < TOL reduce to single comparisons
+    against bounds computed once. Scalar methods give no such guarantee:
+    their points outside [-TOL, L + TOL] are put in the off bucket first,
+    so that e.g. y > L is not counted as top. Off points are reported
+    separately and left out of the percentages.
+    """
+    lo, hi = TOL, L - TOL
+    batch = BATCH_SAMPLERS.get(method.__name__)
+    if batch is not None:
+        x1, y1, x2, y2 = batch(L, ITERATIONS)
+    else:
+        x1, y1, x2, y2 = _scalar_pairs(method)
+    x = np.concatenate((x1, x2))
+    y = np.concatenate((y1, y2))
+    edge = np.select([y < lo, y > hi, x < lo, x > hi], [0, 1, 2, 3], default=4)
+    if batch is None:
+        edge[(x < -TOL) | (x > L + TOL) | (y < -TOL) | (y > L + TOL)] = 4
+    counts = np.bincount(edge, minlength=5)
+    edge_count = dict(zip(("bottom", "top", "left", "right"), counts[:4].tolist()))
+    off = int(counts[4])
 
     total = sum(edge_count.values())
     print(f"{method_name}:")
@@ -56,6 +85,8 @@ def check_distribution(method, method_name: str):
         pct = count / total * 100 if total else 0
         bar = "#" * int(pct / 2)
         print(f"  {edge:>6}: {pct:5.1f}%  {bar}")
+    if off:
+        print(f"     off: {off} points not on the perimeter")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+"""
+tests/conftest.py
+=================
+Shared pytest configuration.
+
+The suite can run in parallel with pytest-xdist (`make test-parallel`, i.e.
+`pytest -n auto --dist=loadgroup`). The Monte Carlo classes are marked
+`xdist_group("montecarlo")` so that they run together on one worker while
+the other tests are spread over the rest. Without xdist the marker is
+inert.
+
+Tests that only need *some* reproducible stream take the session-wide
+`rng` fixture (one numpy Generator for the whole run); tests whose
+statistical outcome must not depend on test order seed their own.
+"""
+
+import os
+import random
+import zlib
+
+import numpy as np
+import pytest
+
+SESSION_SEED = 0xDEADBEEF
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on the same pytest-xdist worker"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _seed_xdist_worker():
+    """Seed the random module once per xdist worker ("gw0", "gw1", ...).
+
+    A rerun of a test on the same worker id then sees the same stream.
+    Serial runs are left unseeded.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        random.seed(zlib.crc32(worker.encode()))
+
+
+@pytest.fixture(scope="session")
+def rng() -> np.random.Generator:
+    """One PCG64 generator shared by the whole test session."""
+    return np.random.default_rng(SESSION_SEED)
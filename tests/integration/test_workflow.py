@@ -3,14 +3,25 @@ tests/integration/test_workflow.py
 ====================================
 End-to-end integration tests that exercise the full analysis workflow:
 sampling → distance computation → statistical summary.
+
+The Monte Carlo tests draw the pairs of a method in batches through its NumPy
+batch twin (vector_samplers.BATCH_SAMPLERS), from a generator seeded per
+test, so their outcome is reproducible. The tolerance tests stop as soon as
+a confidence interval settles the outcome (mc_prob_within).
+TestScalarSamplersDistribution repeats the convergence and bias checks on
+the scalar square_points samplers themselves (seeded through `rng=`), so a
+wrong boundary mapping there cannot hide behind a correct batch twin.
 """
 
 import sys
 import math
 from pathlib import Path
+from statistics import NormalDist
+from typing import Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import numpy as np
 import pytest
 from square_points import (
     sample_parametric,
@@ -23,7 +34,8 @@ from square_points import (
     sample_polar_angle,
     sample_interior_projection,
 )
-from utils.helpers import is_on_perimeter, euclidean, are_distinct
+from utils.helpers import validate_pair_fast, describe_pair_failures, euclidean_sq
+from vector_samplers import BATCH_SAMPLERS
 
 ALL_METHODS = [
     sample_parametric,
@@ -47,6 +59,59 @@ UNIFORM_METHODS = [
 ]
 
 THEORETICAL_P = 0.3573   # P(d > L) for uniform distribution on the perimeter
+SEED = 20240601
+
+
+def count_hits(method, L: float, n: int, rng: np.random.Generator) -> int:
+    """Number of n pairs drawn by the batch twin of `method` with d > L."""
+    x1, y1, x2, y2 = BATCH_SAMPLERS[method.__name__](L, n, rng)
+    # d > L  ⇔  d² > L²; euclidean_sq works element-wise on the arrays
+    return int(np.count_nonzero(euclidean_sq((x1, y1), (x2, y2)) > L * L))
+
+
+def count_hits_scalar(method, L: float, n: int, rng: np.random.Generator) -> int:
+    """count_hits through the scalar sampler itself, one call per pair."""
+    L2 = L * L
+    sq = euclidean_sq   # local name in the loop body
+    hits = 0
+    for _ in range(n):
+        if sq(*method(L, rng)) > L2:
+            hits += 1
+    return hits
+
+
+def estimate_p(method, L: float, n: int, seed: int = SEED) -> float:
+    """Fraction of n pairs drawn by the batch twin of `method` with d > L."""
+    return count_hits(method, L, n, np.random.default_rng(seed)) / n
+
+
+def mc_prob_within(method, target: float, tol: float, L: float, max_n: int,
+                   confidence: float = 0.999, step: int = 500,
+                   seed: int = SEED, count=count_hits) -> Tuple[bool, float, int]:
+    """Sequential test of |P(d > L) - target| < tol.
+
+    Draws `step` pairs at a time. After each step, the Wald interval
+    p_hat ± z·sqrt(p_hat(1 - p_hat)/n) at the given confidence decides:
+    entirely inside [target - tol, target + tol] passes, entirely outside
+    fails, anything else draws another step. At max_n the point estimate
+    decides. `count` is count_hits or count_hits_scalar. Returns
+    (passed, p_hat, n).
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rng = np.random.default_rng(seed)
+    hits = n = 0
+    while n < max_n:
+        m = min(step, max_n - n)
+        hits += count(method, L, m, rng)
+        n += m
+        p_hat = hits / n
+        half = z * math.sqrt(p_hat * (1 - p_hat) / n)
+        err = abs(p_hat - target)
+        if err + half < tol:
+            return True, p_hat, n
+        if err - half > tol:
+            return False, p_hat, n
+    return err < tol, p_hat, n
 
 
 class TestFullWorkflow:
@@ -56,32 +121,32 @@ class TestFullWorkflow:
     def test_sample_to_distance_pipeline(self, method):
         """Each method must produce valid points and a positive distance."""
         L = 10.0
+        max_d2 = 2 * L * L + 1e-9   # squared diagonal
+        validate = validate_pair_fast   # local name in the loop body
         for _ in range(100):
-            p1, p2 = method(L)
-            assert is_on_perimeter(p1, L), f"{method.__name__}: p1 not on perimeter"
-            assert is_on_perimeter(p2, L), f"{method.__name__}: p2 not on perimeter"
-            assert are_distinct(p1, p2),   f"{method.__name__}: points are identical"
-            d = euclidean(p1, p2)
-            assert d > 0,                  f"{method.__name__}: zero distance"
-            assert d <= math.sqrt(2) * L + 1e-9, f"{method.__name__}: distance exceeds diagonal"
+            (x1, y1), (x2, y2) = method(L)
+            code = validate(x1, y1, x2, y2, L, max_d2)
+            assert code == 0, (
+                f"{method.__name__}: {describe_pair_failures(code)} "
+                f"(p1=({x1}, {y1}), p2=({x2}, {y2}))"
+            )
 
 
+@pytest.mark.xdist_group("montecarlo")
 class TestUniformMethodsConvergence:
     """Verify that the 6 uniform methods converge to the theoretical P(d > L)."""
 
     @pytest.mark.parametrize("method", UNIFORM_METHODS, ids=lambda m: m.__name__)
     def test_probability_within_tolerance(self, method):
-        """P(d > L) should be within ±2 percentage points of 0.3573 for n=10 000."""
-        L = 10.0
-        n = 10_000
-        hits = sum(1 for _ in range(n) if euclidean(*method(L)) > L)
-        p_hat = hits / n
-        assert abs(p_hat - THEORETICAL_P) < 0.02, (
-            f"{method.__name__}: P(d>L) = {p_hat:.4f}, "
+        """P(d > L) should be within ±2 percentage points of 0.3573 (up to n=10 000)."""
+        passed, p_hat, n = mc_prob_within(method, THEORETICAL_P, 0.02, L=10.0, max_n=10_000)
+        assert passed, (
+            f"{method.__name__}: P(d>L) = {p_hat:.4f} after {n} samples, "
             f"expected {THEORETICAL_P} ± 0.02"
         )
 
 
+@pytest.mark.xdist_group("montecarlo")
 class TestNonUniformMethodsBias:
     """Verify that the non-uniform methods produce a meaningfully lower P(d > L)."""
 
@@ -92,24 +157,53 @@ class TestNonUniformMethodsBias:
     ], ids=lambda x: x.__name__ if callable(x) else str(x))
     def test_probability_below_uniform(self, method, upper_bound):
         """Non-uniform methods must produce P(d > L) strictly below the uniform value."""
-        L = 10.0
-        n = 10_000
-        hits = sum(1 for _ in range(n) if euclidean(*method(L)) > L)
-        p_hat = hits / n
+        p_hat = estimate_p(method, L=10.0, n=10_000)
         assert p_hat < upper_bound, (
             f"{method.__name__}: P(d>L) = {p_hat:.4f} is not below {upper_bound}"
         )
 
 
+@pytest.mark.xdist_group("montecarlo")
+class TestScalarSamplersDistribution:
+    """The convergence and bias checks above, on the scalar samplers."""
+
+    @pytest.mark.parametrize("method", UNIFORM_METHODS, ids=lambda m: m.__name__)
+    def test_probability_within_tolerance(self, method):
+        passed, p_hat, n = mc_prob_within(method, THEORETICAL_P, 0.02, L=10.0, max_n=10_000,
+                                          count=count_hits_scalar)
+        assert passed, (
+            f"{method.__name__}: P(d>L) = {p_hat:.4f} after {n} samples, "
+            f"expected {THEORETICAL_P} ± 0.02"
+        )
+
+    @pytest.mark.parametrize("method,upper_bound", [
+        (sample_polar_ray,           0.350),
+        (sample_polar_angle,         0.350),
+        (sample_interior_projection, 0.320),
+    ], ids=lambda x: x.__name__ if callable(x) else str(x))
+    def test_probability_below_uniform(self, method, upper_bound):
+        p_hat = count_hits_scalar(method, 10.0, 10_000, np.random.default_rng(SEED)) / 10_000
+        assert p_hat < upper_bound, (
+            f"{method.__name__}: P(d>L) = {p_hat:.4f} is not below {upper_bound}"
+        )
+
+
+@pytest.mark.xdist_group("montecarlo")
 class TestConsistencyAcrossSideLengths:
     """P(d > L) / L should be scale-invariant (depends only on shape, not size)."""
 
     @pytest.mark.parametrize("L", [1.0, 10.0, 100.0])
     def test_scale_invariance(self, L):
         """The ratio P(d > L) should be the same regardless of L."""
-        n = 5_000
-        hits = sum(1 for _ in range(n) if euclidean(*sample_parametric(L)) > L)
-        p_hat = hits / n
-        assert abs(p_hat - THEORETICAL_P) < 0.03, (
-            f"L={L}: P(d>L) = {p_hat:.4f}, expected ≈ {THEORETICAL_P}"
+        passed, p_hat, n = mc_prob_within(sample_parametric, THEORETICAL_P, 0.03, L, max_n=5_000)
+        assert passed, (
+            f"L={L}: P(d>L) = {p_hat:.4f} after {n} samples, expected ≈ {THEORETICAL_P}"
         )
+
+
+class TestMcProbWithin:
+    """The sequential helper itself: it must also be able to fail."""
+
+    def test_rejects_wrong_target(self):
+        passed, _, n = mc_prob_within(sample_parametric, 0.25, 0.02, L=10.0, max_n=10_000)
+        assert not passed and n < 10_000
@@ -0,0 +1,90 @@
+"""
+tests/test_altri_square_points.py
+==================================
+Test suite for altri_square_points.py.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pytest
+from altri_square_points import (
+    compile_parametric_v0,
+    make_parametric_v0,
+    sample_parametric_v0,
+    sample_by_side_v0,
+    sample_cartesian_v0,
+    sample_polar_angle_v0,
+    sample_interior_projection_v0,
+    SAMPLER_FACTORIES,
+)
+from utils.helpers import is_on_perimeter
+
+ALL_METHODS = [
+    sample_parametric_v0,
+    sample_by_side_v0,
+    sample_cartesian_v0,
+    sample_polar_angle_v0,
+    sample_interior_projection_v0,
+]
+
+
+@pytest.mark.parametrize("method", ALL_METHODS, ids=lambda m: m.__name__)
+class TestSamplers:
+
+    @pytest.mark.parametrize("L", [0.1, 1.0, 10.0, 1000.0])
+    def test_points_on_perimeter(self, method, L):
+        for _ in range(200):
+            p1, p2 = method(L)
+            assert is_on_perimeter(p1, L, tol=1e-7)
+            assert is_on_perimeter(p2, L, tol=1e-7)
+
+    def test_random_seed_is_reproducible(self, method):
+        random.seed(42)
+        a = method(10.0)
+        random.seed(42)
+        assert method(10.0) == a
+
+    def test_rng_is_reproducible(self, method):
+        assert method(10.0, random.Random(7)) == method(10.0, random.Random(7))
+
+
+@pytest.mark.parametrize("make, method",
+                         [(make, method) for (_, make), method in zip(SAMPLER_FACTORIES, ALL_METHODS)],
+                         ids=[m.__name__ for m in ALL_METHODS])
+def test_factory_matches_sampler(make, method):
+    """A factory built with an rng draws the same pairs as the sampler with that rng."""
+    sample = make(10.0, random.Random(3))
+    rng = random.Random(3)
+    for _ in range(5):
+        assert sample() == method(10.0, rng)
+
+
+@pytest.mark.parametrize("make", [make for _, make in SAMPLER_FACTORIES],
+                         ids=[m.__name__ for m in ALL_METHODS])
+def test_factory_is_cached_per_L(make):
+    assert make(10.0) is make(10.0)
+    assert make(10.0) is not make(5.0)
+
+
+class TestCompileParametric:
+
+    def test_matches_make_parametric(self):
+        sample = compile_parametric_v0(10.0, random.Random(5))
+        expected = make_parametric_v0(10.0, random.Random(5))
+        for _ in range(20):
+            assert sample() == expected()
+
+    @pytest.mark.parametrize("L", [np.float64(10.0), np.float32(2.5), np.int64(3), 7])
+    def test_numpy_and_int_L(self, L):
+        p1, p2 = compile_parametric_v0(L)()
+        assert is_on_perimeter(p1, float(L)) and is_on_perimeter(p2, float(L))
+
+    @pytest.mark.parametrize("L", [float("inf"), float("nan"), 0.0, -1.0])
+    def test_rejects_invalid_L(self, L):
+        with pytest.raises(ValueError):
+            compile_parametric_v0(L)
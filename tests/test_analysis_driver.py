@@ -0,0 +1,37 @@
+"""
+tests/test_analysis_driver.py
+==============================
+Test suite for the table / CSV output of analysis_driver.py.
+"""
+
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis_driver import CSV_HEADER, HEADER, main
+
+
+def fake_analyze(L, iterations):
+    return [(iterations // 2, iterations, 1.0, 0.5, 0.0, 2.0, iterations, 0),
+            (0, iterations, 0.5, 0.25, 0.0, 1.0, 0, iterations)]
+
+
+class TestMain:
+
+    def test_prints_one_table_per_iteration_count(self, capsys):
+        main(["a", "b"], fake_analyze, [10, 20], L=1.0)
+        out = capsys.readouterr().out
+        assert out.count(HEADER) == 2
+        assert "iterations=20" in out
+
+    def test_writes_csv_rows(self, tmp_path, capsys):
+        path = tmp_path / "results.csv"
+        main(["a", "b"], fake_analyze, 10, L=1.0, csv_path=str(path))
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == CSV_HEADER
+        assert len(rows) == 3
+        assert rows[1][:4] == ["a", "10", "5", "10"] and rows[1][4] == "50.000"
+        assert "Results written to" in capsys.readouterr().out
@@ -0,0 +1,64 @@
+"""
+tests/test_distance_analysis.py
+================================
+Test suite for the streaming statistics of distance_analysis.py.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pytest
+from distance_analysis import N, run_all, summarize, _accumulate, _new_stats
+
+
+class TestAccumulate:
+
+    def test_chunks_match_full_matrix(self):
+        """Folding uneven chunks gives the statistics of the whole matrix."""
+        L = 10.0
+        distances = np.random.default_rng(3).random((N, 1000)) * 14
+        min_wins = np.bincount(distances.argmin(axis=0), minlength=N)
+        max_wins = np.bincount(distances.argmax(axis=0), minlength=N)
+
+        stats = _new_stats()
+        for lo, hi in [(0, 1), (1, 300), (300, 301), (301, 1000)]:
+            chunk = distances[:, lo:hi]
+            _accumulate(stats, chunk,
+                        np.bincount(chunk.argmin(axis=0), minlength=N),
+                        np.bincount(chunk.argmax(axis=0), minlength=N), L)
+
+        assert (stats["count"] == 1000).all()
+        assert np.array_equal(stats["count_gt_L"], (distances > L).sum(axis=1))
+        assert np.allclose(stats["mean"], distances.mean(axis=1))
+        assert np.allclose(np.sqrt(stats["m2"] / 1000), distances.std(axis=1))
+        assert np.array_equal(stats["min"], distances.min(axis=1))
+        assert np.array_equal(stats["max"], distances.max(axis=1))
+        assert np.array_equal(stats["min_wins"], min_wins)
+        assert np.array_equal(stats["max_wins"], max_wins)
+
+
+class TestRunAll:
+
+    @pytest.mark.parametrize("rng", [None, np.random.default_rng(5)])
+    def test_counts_and_bounds(self, rng):
+        L = 10.0
+        stats = summarize(run_all(L, 1000, rng, chunk_size=128), L)
+        assert len(stats) == N
+        for count, attempts, mean, std, d_min, d_max, _, _ in stats:
+            assert attempts == 1000
+            assert 0 <= count <= attempts
+            assert 0 <= d_min <= mean <= d_max <= np.sqrt(2) * L + 1e-9
+            assert std >= 0
+        assert sum(s[6] for s in stats) == 1000
+        assert sum(s[7] for s in stats) == 1000
+
+    @pytest.mark.parametrize("L", [0.0, -1.0])
+    def test_rejects_non_positive_L(self, L):
+        with pytest.raises(ValueError):
+            run_all(L, 10)
+
+    def test_zero_iterations(self):
+        assert summarize(run_all(10.0, 0), 10.0) == [(0, 0, 0.0, 0.0, 0.0, 0.0, 0, 0)] * N
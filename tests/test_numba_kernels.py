@@ -0,0 +1,56 @@
+"""
+tests/test_numba_kernels.py
+============================
+Test suite for numba_kernels.py. The kernels are also exercised when numba
+is not installed, in which case they run as plain Python.
+"""
+
+import sys
+import math
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pytest
+from numba_kernels import METHOD_IDS, sample_method_nb, run_all_nb, count_hits_nb
+from utils.helpers import is_on_perimeter, are_distinct
+
+
+@pytest.mark.parametrize("name", list(METHOD_IDS))
+def test_sampler_points_on_perimeter(name):
+    L = 10.0
+    for _ in range(200):
+        x1, y1, x2, y2 = sample_method_nb(METHOD_IDS[name], L)
+        assert is_on_perimeter((x1, y1), L)
+        assert is_on_perimeter((x2, y2), L)
+        assert are_distinct((x1, y1), (x2, y2))
+
+
+class TestRunAllNb:
+
+    def test_shapes_and_win_counts(self):
+        methods = np.array(list(METHOD_IDS.values()), dtype=np.int64)
+        distances, min_wins, max_wins = run_all_nb(10.0, 300, methods)
+        assert distances.shape == (len(methods), 300)
+        assert min_wins.sum() == 300 and max_wins.sum() == 300
+
+    def test_wins_match_distance_matrix(self):
+        methods = np.array(list(METHOD_IDS.values()), dtype=np.int64)
+        distances, min_wins, max_wins = run_all_nb(10.0, 300, methods)
+        k = len(methods)
+        assert min_wins.tolist() == np.bincount(distances.argmin(axis=0), minlength=k).tolist()
+        assert max_wins.tolist() == np.bincount(distances.argmax(axis=0), minlength=k).tolist()
+        assert (distances <= math.sqrt(2) * 10.0 + 1e-9).all()
+
+
+class TestCountHitsNb:
+
+    def test_bounds(self):
+        hits = count_hits_nb(10.0, 1000, METHOD_IDS["sample_parametric"])
+        assert 0 <= hits <= 1000
+
+    def test_uniform_probability(self):
+        n = 20000
+        p = count_hits_nb(10.0, n, METHOD_IDS["sample_parametric"]) / n
+        assert abs(p - 0.3573) < 0.02
@@ -0,0 +1,34 @@
+"""
+tests/test_square_core.py
+==========================
+Test suite for the optional Cython extension _square_core.pyx.
+Skipped when the extension has not been built.
+"""
+
+import sys
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from square_points import _perimeter_to_xy
+
+core = pytest.importorskip("_square_core")
+
+
+@pytest.mark.parametrize("L", [0.1, 1.0, 10.0, 1000.0])
+def test_perimeter_to_xy_matches_python(L):
+    for _ in range(1000):
+        t = random.uniform(-4 * L, 8 * L)
+        assert core.perimeter_to_xy(t, L) == pytest.approx(_perimeter_to_xy(t, L), abs=1e-9 * L)
+
+
+class TestMonteCarloParametric:
+
+    def test_reproducible_with_seed(self):
+        assert core.monte_carlo_parametric(10.0, 1000, seed=3) == core.monte_carlo_parametric(10.0, 1000, seed=3)
+
+    def test_uniform_probability(self):
+        n = 200_000
+        assert abs(core.monte_carlo_parametric(10.0, n) / n - 0.3573) < 0.01
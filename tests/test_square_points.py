@@ -10,7 +10,8 @@ Changes compared to the original version
   this test would have caught the original bug.
 - Added `test_side_distribution_is_balanced` which checks the statistical
   distribution of sample_by_side.
-- Uses `_is_distinct` from the library instead of duplicating the logic.
+- Uses `_is_distinct_fast` from the library and `is_on_perimeter` / `side_of`
+  from utils.helpers instead of duplicating the logic.
 - Improved edge-case coverage for very small and very large values of L.
 """
 
@@ -20,6 +21,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import math
+import random
+import numpy as np
 import pytest
 from square_points import (
     sample_parametric,
@@ -31,8 +34,15 @@ from square_points import (
     sample_cartesian,
     sample_polar_angle,
     sample_interior_projection,
+    make_polar_sampler,
+    UniformPool,
+    iter_sample_parametric,
+    iter_sample_by_side,
     _is_distinct,
+    _is_distinct_fast,
 )
+from utils.helpers import is_on_perimeter, side_of
+from vector_samplers import on_perimeter_batch
 
 ALL_METHODS = [
     sample_parametric,
@@ -47,33 +57,6 @@ ALL_METHODS = [
 ]
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# HELPERS
-# ─────────────────────────────────────────────────────────────────────────────
-
-def is_on_perimeter(point: tuple, L: float, tol: float = 1e-9) -> bool:
-    """Return True if the point lies on the perimeter of the square [0,L]×[0,L]."""
-    x, y = point
-    on_bottom = abs(y) < tol and 0 <= x <= L
-    on_top    = abs(y - L) < tol and 0 <= x <= L
-    on_left   = abs(x) < tol and 0 <= y <= L
-    on_right  = abs(x - L) < tol and 0 <= y <= L
-    return on_bottom or on_top or on_left or on_right
-
-
-def side_of(point: tuple, L: float, tol: float = 1e-9) -> str:
-    """Return the side the point lies on ('bottom', 'top', 'left', 'right',
-    or 'corner' for vertices)."""
-    x, y = point
-    sides = []
-    if abs(y) < tol:       sides.append("bottom")
-    if abs(y - L) < tol:   sides.append("top")
-    if abs(x) < tol:       sides.append("left")
-    if abs(x - L) < tol:   sides.append("right")
-    if len(sides) > 1:     return "corner"
-    return sides[0] if sides else "off"
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # PARAMETRIC TESTS — run on all methods
 # ─────────────────────────────────────────────────────────────────────────────
@@ -95,14 +78,15 @@ class TestAllMethods:
     def test_points_are_distinct(self, method):
         for _ in range(20):   # 20 calls to reduce false negatives
             p1, p2 = method(10)
-            assert _is_distinct(p1, p2), f"Identical points: {p1}"
+            assert _is_distinct_fast(p1, p2), f"Identical points: {p1}"
 
-    @pytest.mark.parametrize("L", [0.1, 1.0, 5.0, 10.0, 100.0, 1000.0])
-    def test_works_for_various_L(self, method, L):
-        p1, p2 = method(L)
-        assert is_on_perimeter(p1, L, tol=1e-7)
-        assert is_on_perimeter(p2, L, tol=1e-7)
-        assert _is_distinct(p1, p2)
+    def test_works_for_various_L(self, method):
+        # One test item per method; the failing L is named in the message.
+        for L in (0.1, 1.0, 5.0, 10.0, 100.0, 1000.0):
+            p1, p2 = method(L)
+            assert is_on_perimeter(p1, L, tol=1e-7), f"L={L}: P1={p1} is not on the perimeter"
+            assert is_on_perimeter(p2, L, tol=1e-7), f"L={L}: P2={p2} is not on the perimeter"
+            assert _is_distinct_fast(p1, p2), f"L={L}: identical points {p1}"
 
     def test_coordinates_within_bounds(self, method):
         L = 10
@@ -111,6 +95,29 @@ class TestAllMethods:
             assert 0 <= p[0] <= L, f"x={p[0]} out of [0,{L}]"
             assert 0 <= p[1] <= L, f"y={p[1]} out of [0,{L}]"
 
+    def test_rng_makes_results_reproducible(self, method):
+        a = [method(10, random.Random(42)) for _ in range(3)]
+        b = [method(10, random.Random(42)) for _ in range(3)]
+        assert a == b
+
+    def test_accepts_numpy_generator(self, method, rng):
+        L = 10
+        for _ in range(20):
+            p1, p2 = method(L, rng)
+            assert is_on_perimeter(p1, L) and is_on_perimeter(p2, L)
+
+    def test_numpy_generator_is_reproducible(self, method):
+        a = method(10, np.random.default_rng(5))
+        b = method(10, np.random.default_rng(5))
+        assert a == b
+
+    def test_rng_leaves_module_generator_untouched(self, method):
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        method(10, random.Random(0))
+        assert random.random() == expected
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # METHOD-SPECIFIC TESTS
@@ -129,11 +136,12 @@ class TestSampleBySideFix:
         L = 10
         N = 2000   # Probability of 0 successes in 2000 tries ≈ (3/4)^2000 ≈ 0
         found_same_side = False
+        sample, side = sample_by_side, side_of   # locals in the loop
 
         for _ in range(N):
-            p1, p2 = sample_by_side(L)
-            s1 = side_of(p1, L)
-            s2 = side_of(p2, L)
+            p1, p2 = sample(L)
+            s1 = side(p1, L)
+            s2 = side(p2, L)
             # Two points at a corner have side="corner" — skip them
             if s1 not in ("corner", "off") and s2 not in ("corner", "off"):
                 if s1 == s2:
@@ -151,19 +159,22 @@ class TestSampleBySideFix:
         L = 10
         N = 4000
         counts = {"bottom": 0, "top": 0, "left": 0, "right": 0}
+        sample, side = sample_by_side, side_of   # locals in the loop
 
         for _ in range(N):
-            p1, p2 = sample_by_side(L)
-            for p in (p1, p2):
-                s = side_of(p, L)
-                if s in counts:
-                    counts[s] += 1
+            p1, p2 = sample(L)
+            s = side(p1, L)
+            if s in counts:
+                counts[s] += 1
+            s = side(p2, L)
+            if s in counts:
+                counts[s] += 1
 
         total = sum(counts.values())
-        for side, count in counts.items():
+        for label, count in counts.items():
             pct = count / total
             assert 0.18 < pct < 0.32, (
-                f"Side '{side}': {pct*100:.1f}% (expected ~25%). "
+                f"Side '{label}': {pct*100:.1f}% (expected ~25%). "
                 "Distribution is too unbalanced."
             )
 
@@ -181,16 +192,99 @@ class TestSamplePolarRay:
             assert dist > 0, "Point coincides with the center"
 
 
+class TestMakePolarSampler:
+    """Tests for the L-specialized polar angle sampler."""
+
+    @pytest.mark.parametrize("L", [0.01, 1, 10, 1000])
+    def test_points_on_perimeter(self, L):
+        sampler = make_polar_sampler(L)
+        for _ in range(200):
+            p1, p2 = sampler()
+            assert is_on_perimeter(p1, L)
+            assert is_on_perimeter(p2, L)
+            assert _is_distinct_fast(p1, p2)
+
+    def test_matches_sample_polar_angle(self):
+        random.seed(12)
+        expected = sample_polar_angle(10.0)
+        random.seed(12)
+        assert make_polar_sampler(10.0)() == expected
+
+
+@pytest.mark.parametrize("gen", [iter_sample_parametric, iter_sample_by_side])
+class TestBulkGenerators:
+    """Tests for the chunked iter_sample_* generators."""
+
+    @pytest.mark.parametrize("n", [0, 1, 1024, 2500])
+    def test_yields_n_pairs(self, gen, n):
+        assert sum(1 for _ in gen(10.0, n)) == n
+
+    def test_points_on_perimeter(self, gen):
+        L = 10.0
+        for p1, p2 in gen(L, 2000):
+            assert is_on_perimeter(p1, L)
+            assert is_on_perimeter(p2, L)
+
+    def test_rng_makes_results_reproducible(self, gen):
+        assert list(gen(10.0, 50, random.Random(3))) == list(gen(10.0, 50, random.Random(3)))
+
+    def test_accepts_numpy_generator(self, gen, rng):
+        L = 10.0
+        for p1, p2 in gen(L, 100, rng):
+            assert is_on_perimeter(p1, L) and is_on_perimeter(p2, L)
+
+    def test_numpy_generator_draws_in_blocks(self, gen):
+        """A Generator's block draw consumes the same uniforms, in order, as per-call draws."""
+        L, n = 10.0, 300
+        pool = UniformPool(np.random.default_rng(5).random(4 * n).tolist())
+        assert list(gen(L, n, np.random.default_rng(5))) == list(gen(L, n, pool))
+
+    def test_accepts_uniform_pool(self, gen, rng):
+        L = 10.0
+        pairs = list(gen(L, 100, UniformPool(rng.random(4 * 100).tolist())))
+        assert len(pairs) == 100
+        assert all(is_on_perimeter(p1, L) and is_on_perimeter(p2, L) for p1, p2 in pairs)
+
+
 class TestSampleInteriorProjection:
     """Additional tests for the interior projection method."""
 
     def test_runs_without_errors(self):
-        """Verify the function runs correctly for many iterations without exceptions."""
+        """Verify the function runs correctly for many iterations without exceptions.
+
+        Every pair is drawn, but only the first 10 and every 100th after
+        that are checked; the perimeter itself is covered by TestAllMethods.
+        """
         L = 10
-        for _ in range(500):
+        for i in range(500):
             p1, p2 = sample_interior_projection(L)
-            assert is_on_perimeter(p1, L)
-            assert is_on_perimeter(p2, L)
+            if i < 10 or i % 100 == 0:
+                assert is_on_perimeter(p1, L), f"iteration {i}: p1={p1} off perimeter"
+                assert is_on_perimeter(p2, L), f"iteration {i}: p2={p2} off perimeter"
+
+
+class TestUniformPool:
+
+    def test_replays_the_pool(self):
+        pool = UniformPool([0.0, 0.25, 0.5, 0.99])
+        assert [pool.random(), pool.random()] == [0.0, 0.25]
+        assert [pool.getrandbits(2), pool.getrandbits(2)] == [2, 3]
+        with pytest.raises(StopIteration):
+            pool.random()
+
+    @pytest.mark.parametrize("method", ALL_METHODS, ids=lambda m: m.__name__)
+    def test_same_pool_same_pair(self, method):
+        u = [random.random() for _ in range(4)]
+        assert method(10.0, UniformPool(u)) == method(10.0, UniformPool(u))
+
+
+class TestIsDistinct:
+
+    def test_tolerance_vs_exact(self):
+        p, q = (1.0, 2.0), (1.0 + 1e-13, 2.0)
+        assert not _is_distinct(p, q)      # within the 1e-12 tolerance
+        assert _is_distinct_fast(p, q)     # but not bit-identical
+        assert not _is_distinct_fast(p, (1.0, 2.0))
 
 
 class TestHelperPerimeterToXY:
@@ -218,6 +312,24 @@ class TestHelperPerimeterToXY:
         # t = 4L should equal t = 0 (modulo)
         assert _perimeter_to_xy(4 * L, L) == _perimeter_to_xy(0, L)
         assert _perimeter_to_xy(5 * L, L) == _perimeter_to_xy(L, L)
+        assert _perimeter_to_xy(4.5 * L, L) == (L / 2, 0.0)
+        assert _perimeter_to_xy(8 * L + 1.5 * L, L) == (L, L / 2)
+
+    def test_negative_t(self):
+        from square_points import _perimeter_to_xy
+        L = 10.0
+        assert _perimeter_to_xy(-L / 2, L) == (0.0, L / 2)   # wraps onto the left side
+        assert _perimeter_to_xy(-4 * L, L) == (0.0, 0.0)
+        # t % 4L rounds up to exactly 4L: the bottom-left corner, not an error
+        assert _perimeter_to_xy(-1e-17, L) == (0.0, 0.0)
+
+    def test_sample_parametric_agrees(self):
+        """sample_parametric maps corners and t just below 4L as _perimeter_to_xy does."""
+        from square_points import _perimeter_to_xy
+        L = 10.0
+        for u in (0.0, 0.25, 0.5, 0.75, 1 - 2 ** -53):
+            expected = _perimeter_to_xy(u * 4 * L, L)
+            assert sample_parametric(L, UniformPool([u, u])) == (expected, expected)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -226,12 +338,20 @@ class TestHelperPerimeterToXY:
 
 class TestComparative:
 
-    def test_all_methods_valid_1000_iterations(self):
-        """All methods must complete 1000 iterations without errors."""
+    def test_all_methods_valid_1000_iterations(self, rng):
+        """All methods must complete 1000 iterations without errors.
+
+        The uniforms of each method come from one bulk draw of the session
+        rng (a UniformPool); the pairs are collected into one array and
+        checked with vectorized reductions instead of one helper call per point.
+        """
         L = 10
         for method in ALL_METHODS:
-            for _ in range(1000):
-                p1, p2 = method(L)
-                assert is_on_perimeter(p1, L), f"{method.__name__}: p1 off perimeter"
-                assert is_on_perimeter(p2, L), f"{method.__name__}: p2 off perimeter"
-                assert _is_distinct(p1, p2),   f"{method.__name__}: identical points"
+            pool = UniformPool(rng.random(4 * 1000).tolist())
+            pairs = [(x1, y1, x2, y2) for (x1, y1), (x2, y2) in (method(L, pool) for _ in range(1000))]
+            x1, y1, x2, y2 = np.array(pairs).T
+            assert on_perimeter_batch(x1, y1, L).all(), f"{method.__name__}: p1 off perimeter"
+            assert on_perimeter_batch(x2, y2, L).all(), f"{method.__name__}: p2 off perimeter"
+            assert ((x1 != x2) | (y1 != y2)).all(), (
+                f"{method.__name__}: identical points"
+            )
@@ -0,0 +1,98 @@
+"""
+tests/test_vector_samplers.py
+==============================
+Test suite for vector_samplers.py.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pytest
+from vector_samplers import (
+    BATCH_SAMPLERS, sample_all_methods, on_perimeter_batch,
+    _perimeter_to_xy_batch, _ray_to_xy_batch, _angle_to_xy_batch,
+)
+from square_points import _perimeter_to_xy
+from utils.helpers import is_on_perimeter
+
+
+@pytest.mark.parametrize("name", list(BATCH_SAMPLERS))
+class TestBatchSamplers:
+
+    def test_shapes(self, name):
+        arrays = BATCH_SAMPLERS[name](10.0, 50)
+        assert len(arrays) == 4
+        for a in arrays:
+            assert a.shape == (50,) and a.dtype == np.float64
+
+    @pytest.mark.parametrize("L", [0.1, 1.0, 10.0, 1000.0])
+    def test_points_on_perimeter(self, name, L, rng):
+        x1, y1, x2, y2 = BATCH_SAMPLERS[name](L, 1000, rng)
+        assert on_perimeter_batch(x1, y1, L, tol=1e-7).all()
+        assert on_perimeter_batch(x2, y2, L, tol=1e-7).all()
+
+    def test_reproducible_with_seed(self, name):
+        a = BATCH_SAMPLERS[name](10.0, 20, np.random.default_rng(1))
+        b = BATCH_SAMPLERS[name](10.0, 20, np.random.default_rng(1))
+        for u, v in zip(a, b):
+            assert np.array_equal(u, v)
+
+
+class TestOnPerimeterBatch:
+
+    def test_matches_is_on_perimeter(self):
+        L = 10.0
+        points = [(5.0, 0.0), (5.0, L), (0.0, 5.0), (L, 5.0), (0.0, 0.0), (L, L),
+                  (5.0, 5.0), (11.0, 0.0), (5.0, -1.0), (5.0, 1e-10), (5.0, 1e-8)]
+        x, y = np.array(points).T
+        assert on_perimeter_batch(x, y, L).tolist() == [is_on_perimeter(p, L) for p in points]
+
+
+class TestPerimeterToXYBatch:
+
+    def test_matches_scalar_helper(self):
+        L = 10.0
+        t = np.array([0.0, 2.5, L, 1.5 * L, 2 * L, 2.5 * L, 3 * L, 3.5 * L, 4 * L - 1e-9])
+        x, y = _perimeter_to_xy_batch(t, L)
+        for ti, xi, yi in zip(t, x, y):
+            assert (xi, yi) == pytest.approx(_perimeter_to_xy(ti, L))
+
+
+class TestRayToXYBatch:
+
+    def test_matches_angle_ratio_mapping(self):
+        L = 10.0
+        theta = np.linspace(0, 2 * np.pi, 1001)
+        x, y = _ray_to_xy_batch(theta, L)
+        xa, ya = _angle_to_xy_batch(theta, L)
+        assert np.allclose(x, xa) and np.allclose(y, ya)
+
+    def test_axis_aligned_rays(self):
+        L = 10.0
+        x, y = _ray_to_xy_batch(np.array([0.0, np.pi / 2, np.pi, 3 * np.pi / 2]), L)
+        assert np.allclose(x, [L, 5.0, 0.0, 5.0])
+        assert np.allclose(y, [5.0, L, 5.0, 0.0])
+
+
+class TestSampleAllMethods:
+
+    def test_shape_and_range(self):
+        L = 10.0
+        d = sample_all_methods(L, 500)
+        assert d.shape == (len(BATCH_SAMPLERS), 500)
+        assert (d >= 0).all() and (d <= np.sqrt(2) * L + 1e-9).all()
+
+    def test_method_subset_in_given_order(self):
+        methods = ["sample_interior_projection", "sample_parametric"]
+        d = sample_all_methods(10.0, 100, methods)
+        assert d.shape == (2, 100)
+
+    def test_matches_batch_samplers(self):
+        """With the same seed, the rows equal the per-method batch twins."""
+        L = 10.0
+        d = sample_all_methods(L, 50, ["sample_cartesian"], np.random.default_rng(7))
+        x1, y1, x2, y2 = BATCH_SAMPLERS["sample_cartesian"](L, 50, np.random.default_rng(7))
+        assert np.allclose(d[0], np.hypot(x1 - x2, y1 - y2))
@@ -12,7 +12,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import pytest
 from models.shapes import Square
-from utils.helpers import is_on_perimeter, side_of, euclidean, are_distinct, clamp
+from utils.helpers import (
+    SIDES, is_on_perimeter, side_index, side_of, euclidean, euclidean_sq,
+    are_distinct, clamp, validate_pair_fast, describe_pair_failures,
+)
 
 
 # ── Square model ──────────────────────────────────────────────────────────────
@@ -51,6 +54,20 @@ class TestSquareProperties:
         assert Square(10) == Square(10)
         assert Square(10) != Square(5)
 
+    def test_slotted(self):
+        sq = Square(10)
+        assert not hasattr(sq, "__dict__")
+        with pytest.raises(AttributeError):
+            sq.colour = "red"
+
+    def test_immutable(self):
+        sq = Square(10)
+        with pytest.raises(AttributeError):
+            sq.L = 5
+        with pytest.raises(AttributeError):
+            del sq.area
+        assert (sq.L, sq.perimeter, sq.area) == (10, 40, 100)
+
 
 class TestSquareOnPerimeter:
 
@@ -107,6 +124,10 @@ class TestSquareDistance:
     def test_horizontal(self):
         assert math.isclose(Square.distance((0, 5), (10, 5)), 10.0)
 
+    def test_distance_sq(self):
+        assert Square.distance_sq((0, 0), (3, 4)) == 25.0
+        assert Square.distance_sq((3, 4), (3, 4)) == 0.0
+
 
 # ── Helper functions ──────────────────────────────────────────────────────────
 
@@ -130,6 +151,13 @@ class TestIsOnPerimeter:
     def test_outside(self):
         assert not is_on_perimeter((12, 5), 10)
 
+    def test_within_tolerance_of_a_side(self):
+        assert is_on_perimeter((5, -1e-10), 10)
+        assert is_on_perimeter((10 + 1e-10, 5), 10)
+
+    def test_just_outside_a_corner(self):
+        assert not is_on_perimeter((-1e-10, -1e-10), 10)
+
 
 class TestSideOf:
 
@@ -153,6 +181,13 @@ class TestSideOf:
         assert side_of((5, 5), 10) == "off"
 
 
+class TestSideIndex:
+
+    def test_indexes_side_labels(self):
+        points = [(5, 0), (5, 10), (0, 5), (10, 5), (0, 10), (5, 5)]
+        assert [SIDES[side_index(p, 10)] for p in points] == list(SIDES)
+
+
 class TestEuclidean:
 
     def test_pythagorean(self):
@@ -161,6 +196,9 @@ class TestEuclidean:
     def test_zero(self):
         assert euclidean((2, 3), (2, 3)) == 0.0
 
+    def test_squared(self):
+        assert euclidean_sq((0, 0), (3, 4)) == 25.0
+
 
 class TestAreDistinct:
 
@@ -174,6 +212,30 @@ class TestAreDistinct:
         assert not are_distinct((0, 0), (1e-13, 0))
 
 
+class TestValidatePairFast:
+
+    def test_valid_pair(self):
+        assert validate_pair_fast(5, 0, 10, 5, 10, 200) == 0
+
+    def test_failure_bits(self):
+        assert validate_pair_fast(5, 5, 10, 5, 10, 200) == 1          # p1 inside
+        assert validate_pair_fast(5, 0, 12, 5, 10, 200) == 2          # p2 outside
+        assert validate_pair_fast(5, 0, 5, 0, 10, 200) == 4 | 8       # identical
+        assert validate_pair_fast(0, 0, 10, 10, 10, 150) == 16        # beyond max_d2
+
+    @pytest.mark.parametrize("p1, p2", [((5, 0), (10, 5)), ((5, 5), (0, 3)), ((1, 0), (1, 0)),
+                                        ((0, -1e-10), (3, 10)), ((11, 0), (0, 0))])
+    def test_matches_separate_helpers(self, p1, p2):
+        code = validate_pair_fast(*p1, *p2, 10, 200)
+        assert bool(code & 1) == (not is_on_perimeter(p1, 10))
+        assert bool(code & 2) == (not is_on_perimeter(p2, 10))
+        assert bool(code & 4) == (not are_distinct(p1, p2))
+
+    def test_describe(self):
+        assert describe_pair_failures(0) == ""
+        assert describe_pair_failures(1 | 4) == "p1 not on perimeter, points are identical"
+
+
 class TestClamp:
 
     def test_within_range(self):
@@ -9,15 +9,43 @@ from typing import Tuple
 
 Point = Tuple[float, float]
 
+# The hot helpers bind the builtins they call as default arguments
+# (_abs=abs, ...), which makes them fast locals instead of global lookups.
 
-def is_on_perimeter(point: Point, L: float, tol: float = 1e-9) -> bool:
-    """Return True if the point lies on the perimeter of [0, L] × [0, L]."""
+
+def is_on_perimeter(point: Point, L: float, tol: float = 1e-9,
+                    _abs=abs, _min=min) -> bool:
+    """Return True if the point lies on the perimeter of [0, L] × [0, L].
+
+    A point is on a horizontal side when its distance to the nearer of
+    y = 0 and y = L is below tol and 0 <= x <= L (vertical sides alike).
+    """
+    x, y = point
+    return ((_min(_abs(y), _abs(y - L)) < tol and 0 <= x <= L)
+            or (_min(_abs(x), _abs(x - L)) < tol and 0 <= y <= L))
+
+
+SIDES = ("bottom", "top", "left", "right", "corner", "off")
+
+
+def side_index(point: Point, L: float, tol: float = 1e-9, _abs=abs) -> int:
+    """Return the index in SIDES of the side label of a perimeter point.
+
+    Plain float comparisons only, no per-call allocations: suitable for
+    classifying many points in a loop.
+    """
     x, y = point
-    on_bottom = abs(y) < tol       and 0 <= x <= L
-    on_top    = abs(y - L) < tol   and 0 <= x <= L
-    on_left   = abs(x) < tol       and 0 <= y <= L
-    on_right  = abs(x - L) < tol   and 0 <= y <= L
-    return on_bottom or on_top or on_left or on_right
+    on_bottom = _abs(y) < tol
+    on_top    = _abs(y - L) < tol
+    on_left   = _abs(x) < tol
+    on_right  = _abs(x - L) < tol
+    hits = on_bottom + on_top + on_left + on_right
+    if hits > 1:  return 4   # corner
+    if hits == 0: return 5   # off
+    if on_bottom: return 0
+    if on_top:    return 1
+    if on_left:   return 2
+    return 3
 
 
 def side_of(point: Point, L: float, tol: float = 1e-9) -> str:
@@ -26,24 +54,74 @@ def side_of(point: Point, L: float, tol: float = 1e-9) -> str:
     Returns one of: 'bottom', 'top', 'left', 'right', 'corner', 'off'.
     Corner points (vertices) that lie on two sides are labelled 'corner'.
     """
-    x, y = point
-    sides = []
-    if abs(y) < tol:     sides.append("bottom")
-    if abs(y - L) < tol: sides.append("top")
-    if abs(x) < tol:     sides.append("left")
-    if abs(x - L) < tol: sides.append("right")
-    if len(sides) > 1:   return "corner"
-    return sides[0] if sides else "off"
+    return SIDES[side_index(point, L, tol)]
 
 
-def euclidean(p1: Point, p2: Point) -> float:
-    """Euclidean distance between two 2-D points."""
-    return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
+def euclidean(p1: Point, p2: Point, _sqrt=math.sqrt) -> float:
+    """Euclidean distance between two 2-D points.
 
+    Uses sqrt(dx² + dy²) rather than math.hypot: the squares cannot overflow
+    for coordinates of any realistic square, so hypot's scaling is not needed.
+    """
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return _sqrt(dx * dx + dy * dy)
 
-def are_distinct(p1: Point, p2: Point, tol: float = 1e-12) -> bool:
+
+def euclidean_sq(p1: Point, p2: Point) -> float:
+    """Squared Euclidean distance; compare with L * L instead of euclidean with L."""
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return dx * dx + dy * dy
+
+
+def are_distinct(p1: Point, p2: Point, tol: float = 1e-12, _abs=abs) -> bool:
     """Return True if the two points are geometrically distinct."""
-    return abs(p1[0] - p2[0]) > tol or abs(p1[1] - p2[1]) > tol
+    return _abs(p1[0] - p2[0]) > tol or _abs(p1[1] - p2[1]) > tol
+
+
+# Failure bits returned by validate_pair_fast, in bit order.
+PAIR_FAILURES = (
+    "p1 not on perimeter",
+    "p2 not on perimeter",
+    "points are identical",
+    "zero distance",
+    "distance exceeds max",
+)
+
+
+def validate_pair_fast(x1: float, y1: float, x2: float, y2: float, L: float,
+                       max_d2: float, tol: float = 1e-9, dist_tol: float = 1e-12,
+                       _abs=abs, _min=min) -> int:
+    """All the checks of a sampled pair in one call, on flat coordinates.
+
+    Combines is_on_perimeter (for both points), are_distinct and the
+    0 < d² <= max_d2 distance bounds. Returns 0 when every check passes,
+    otherwise a bitmask whose set bits index PAIR_FAILURES (see
+    describe_pair_failures).
+    """
+    code = 0
+    if not ((_min(_abs(y1), _abs(y1 - L)) < tol and 0 <= x1 <= L)
+            or (_min(_abs(x1), _abs(x1 - L)) < tol and 0 <= y1 <= L)):
+        code |= 1
+    if not ((_min(_abs(y2), _abs(y2 - L)) < tol and 0 <= x2 <= L)
+            or (_min(_abs(x2), _abs(x2 - L)) < tol and 0 <= y2 <= L)):
+        code |= 2
+    dx = x1 - x2
+    dy = y1 - y2
+    if not (_abs(dx) > dist_tol or _abs(dy) > dist_tol):
+        code |= 4
+    d2 = dx * dx + dy * dy
+    if not d2 > 0:
+        code |= 8
+    if d2 > max_d2:
+        code |= 16
+    return code
+
+
+def describe_pair_failures(code: int) -> str:
+    """Human-readable list of the failures in a validate_pair_fast bitmask."""
+    return ", ".join(msg for bit, msg in enumerate(PAIR_FAILURES) if code >> bit & 1)
 
 
 def clamp(value: float, lo: float, hi: float) -> float:
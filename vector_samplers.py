@@ -0,0 +1,251 @@
+"""
+vector_samplers.py
+==================
+NumPy batch versions of the 9 sampling methods defined in square_points.py.
+
+Each `<method>_batch(L, n, rng=None)` draws `n` point pairs in a single call
+and returns them in Structure-of-Arrays form: four float64 arrays
+`(x1, y1, x2, y2)` of length n. The sampled distributions are the same as
+those of the scalar functions; the distinctness retry is omitted because two
+coincident points have probability zero with continuous uniform draws.
+
+Usage:
+    from vector_samplers import sample_parametric_batch
+    x1, y1, x2, y2 = sample_parametric_batch(L=10.0, n=100_000)
+"""
+
+import math
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+Arrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+BatchSampler = Callable[..., Arrays]
+
+_default_rng = np.random.default_rng()
+
+
+def _get_rng(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    return _default_rng if rng is None else rng
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HELPER FUNCTIONS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _perimeter_to_xy_batch(t: np.ndarray, L: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Vector version of square_points._perimeter_to_xy for t ∈ [0, 4L).
+
+    Branchless: the side index selects each coordinate from a table of
+    per-side expressions in the offset s along that side.
+    """
+    side = np.minimum(t // L, 3).astype(np.int8)
+    s = t - side * L
+    x = np.choose(side, (s, L, L - s, 0.0))
+    y = np.choose(side, (0.0, s, L, L - s))
+    return x, y
+
+
+def on_perimeter_batch(x: np.ndarray, y: np.ndarray, L: float, tol: float = 1e-9) -> np.ndarray:
+    """Element-wise utils.helpers.is_on_perimeter for coordinate arrays (or scalars)."""
+    x, y = np.asarray(x), np.asarray(y)
+    horiz = (np.minimum(np.abs(y), np.abs(y - L)) < tol) & (x >= 0) & (x <= L)
+    vert  = (np.minimum(np.abs(x), np.abs(x - L)) < tol) & (y >= 0) & (y <= L)
+    return horiz | vert
+
+
+def _side_to_xy_batch(side: np.ndarray, s: np.ndarray, L: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Map (side index, position) to (x, y); sides are 0=bottom, 1=top, 2=left, 3=right."""
+    x = np.where(side == 2, 0.0, np.where(side == 3, L, s))
+    y = np.where(side == 0, 0.0, np.where(side == 1, L, s))
+    return x, y
+
+
+def _ray_to_xy_batch(theta: np.ndarray, L: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Boundary point of the ray from the center at angle theta, by ray-wall intersection.
+
+    tx / ty are the ray parameters at which the ray reaches the nearest
+    vertical / horizontal wall (inf for a ray parallel to them); the smaller
+    one is the exit point, whose wall coordinate is exact.
+    """
+    half = L / 2
+    dx, dy = np.cos(theta), np.sin(theta)
+    with np.errstate(divide="ignore"):
+        tx = half / np.abs(dx)
+        ty = half / np.abs(dy)
+    hit_x = tx <= ty
+    t = np.minimum(tx, ty)
+    x = np.where(hit_x, np.where(dx > 0, L, 0.0), np.clip(half + t * dx, 0.0, L))
+    y = np.where(hit_x, np.clip(half + t * dy, 0.0, L), np.where(dy > 0, L, 0.0))
+    return x, y
+
+
+def _angle_to_xy_batch(theta: np.ndarray, L: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Boundary point hit by the ray from the center at polar angle theta."""
+    half = L / 2
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    scale = half / np.maximum(np.abs(cos_t), np.abs(sin_t))
+    x = np.clip(half + cos_t * scale, 0.0, L)
+    y = np.clip(half + sin_t * scale, 0.0, L)
+    return x, y
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# METHOD KERNELS
+# Each kernel maps a (k, n) block of uniforms in [0, 1) to n point pairs;
+# k is the number of uniforms the method consumes per pair (see _KERNELS).
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _parametric(u: np.ndarray, L: float) -> Arrays:
+    t = u * (4 * L)
+    x1, y1 = _perimeter_to_xy_batch(t[0], L)
+    x2, y2 = _perimeter_to_xy_batch(t[1], L)
+    return x1, y1, x2, y2
+
+
+def _by_side(u: np.ndarray, L: float) -> Arrays:
+    side = (u[0::2] * 4).astype(np.intp)
+    s = u[1::2] * L
+    x1, y1 = _side_to_xy_batch(side[0], s[0], L)
+    x2, y2 = _side_to_xy_batch(side[1], s[1], L)
+    return x1, y1, x2, y2
+
+
+def _polar(u: np.ndarray, L: float) -> Arrays:
+    theta = u * (2 * math.pi)
+    x1, y1 = _angle_to_xy_batch(theta[0], L)
+    x2, y2 = _angle_to_xy_batch(theta[1], L)
+    return x1, y1, x2, y2
+
+
+def _polar_ray(u: np.ndarray, L: float) -> Arrays:
+    theta = u * (2 * math.pi)
+    x1, y1 = _ray_to_xy_batch(theta[0], L)
+    x2, y2 = _ray_to_xy_batch(theta[1], L)
+    return x1, y1, x2, y2
+
+
+def _cartesian(u: np.ndarray, L: float) -> Arrays:
+    fix_x = u[0::3] < 0.5
+    wall = (u[1::3] < 0.5) * L
+    s = u[2::3] * L
+    x = np.where(fix_x, wall, s)
+    y = np.where(fix_x, s, wall)
+    return x[0], y[0], x[1], y[1]
+
+
+def _interior_projection(u: np.ndarray, L: float) -> Arrays:
+    x, y = u[0::2] * L, u[1::2] * L
+    horiz = np.minimum(y, L - y) <= np.minimum(x, L - x)
+    px = np.where(horiz, x, np.where(x <= L - x, 0.0, L))
+    py = np.where(horiz, np.where(y <= L - y, 0.0, L), y)
+    return px[0], py[0], px[1], py[1]
+
+
+# (kernel, uniforms per pair) of each scalar method, keyed by its function name.
+_KERNELS: Dict[str, Tuple[Callable[[np.ndarray, float], Arrays], int]] = {
+    "sample_parametric":          (_parametric, 2),
+    "sample_by_side":             (_by_side, 4),
+    "sample_by_edge_label":       (_by_side, 4),
+    "sample_polar_ray":           (_polar_ray, 2),
+    "sample_side_pos":            (_by_side, 4),
+    "sample_parametric_modular":  (_parametric, 2),
+    "sample_cartesian":           (_cartesian, 6),
+    "sample_polar_angle":         (_polar, 2),
+    "sample_interior_projection": (_interior_projection, 4),
+}
+
+
+def _draw(name: str, L: float, n: int, rng: Optional[np.random.Generator]) -> Arrays:
+    kernel, k = _KERNELS[name]
+    return kernel(_get_rng(rng).random((k, n)), L)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BATCH METHODS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def sample_parametric_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_parametric (uniform on the perimeter)."""
+    return _draw("sample_parametric", L, n, rng)
+
+
+def sample_by_side_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_by_side (uniform on the perimeter)."""
+    return _draw("sample_by_side", L, n, rng)
+
+
+def sample_by_edge_label_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_by_edge_label (uniform on the perimeter)."""
+    return _draw("sample_by_edge_label", L, n, rng)
+
+
+def sample_polar_ray_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_polar_ray (uniform over angles)."""
+    return _draw("sample_polar_ray", L, n, rng)
+
+
+def sample_side_pos_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_side_pos (uniform on the perimeter)."""
+    return _draw("sample_side_pos", L, n, rng)
+
+
+def sample_parametric_modular_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_parametric_modular (uniform on the perimeter)."""
+    return _draw("sample_parametric_modular", L, n, rng)
+
+
+def sample_cartesian_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_cartesian: fix x or y to 0 or L, sample the other."""
+    return _draw("sample_cartesian", L, n, rng)
+
+
+def sample_polar_angle_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_polar_angle (uniform over angles)."""
+    return _draw("sample_polar_angle", L, n, rng)
+
+
+def sample_interior_projection_batch(L: float, n: int, rng: Optional[np.random.Generator] = None) -> Arrays:
+    """Batch version of sample_interior_projection (NOT uniform on the perimeter).
+
+    Ties are broken as in the scalar version: horizontal sides before
+    vertical ones, bottom before top, left before right.
+    """
+    return _draw("sample_interior_projection", L, n, rng)
+
+
+# Batch twin of each scalar method, keyed by the scalar function name.
+BATCH_SAMPLERS: Dict[str, BatchSampler] = {
+    "sample_parametric":          sample_parametric_batch,
+    "sample_by_side":             sample_by_side_batch,
+    "sample_by_edge_label":       sample_by_edge_label_batch,
+    "sample_polar_ray":           sample_polar_ray_batch,
+    "sample_side_pos":            sample_side_pos_batch,
+    "sample_parametric_modular":  sample_parametric_modular_batch,
+    "sample_cartesian":           sample_cartesian_batch,
+    "sample_polar_angle":         sample_polar_angle_batch,
+    "sample_interior_projection": sample_interior_projection_batch,
+}
+
+
+def sample_all_methods(L: float, n: int, methods: Optional[Sequence[str]] = None,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Return a (len(methods), n) matrix of pair distances, one row per method.
+
+    `methods` are scalar function names (default: all 9, in BATCH_SAMPLERS
+    order). The uniforms of every method are drawn with a single rng call
+    and sliced per method; the distances of all methods are then computed
+    with a single np.hypot over the stacked coordinate differences.
+    """
+    kernels = [_KERNELS[name] for name in (methods or list(BATCH_SAMPLERS))]
+    u = _get_rng(rng).random((sum(k for _, k in kernels), n))
+
+    dx = np.empty((len(kernels), n))
+    dy = np.empty((len(kernels), n))
+    row = 0
+    for i, (kernel, k) in enumerate(kernels):
+        x1, y1, x2, y2 = kernel(u[row:row + k], L)
+        np.subtract(x1, x2, out=dx[i])
+        np.subtract(y1, y2, out=dy[i])
+        row += k
+    return np.hypot(dx, dy)